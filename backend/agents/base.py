@@ -10,7 +10,7 @@ import logging
 import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field, asdict
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
@@ -138,6 +138,12 @@ class BaseAgent(ABC):
         }
 
 
+# Database paths whose agent_runs schema has already been ensured in this
+# process; jobs build a registry per run, so the DDL only runs the first time.
+_initialized_db_paths = set()
+_init_db_lock = threading.Lock()
+
+
 class AgentRegistry:
     """Registry for all agents with status tracking and run history persistence"""
 
@@ -148,7 +154,16 @@ class AgentRegistry:
         self._init_db()
 
     def _init_db(self):
-        """Create agent_runs table if it doesn't exist"""
+        """Create agent_runs table if it doesn't exist (once per path per process)"""
+        if self.db_path in _initialized_db_paths:
+            return
+        with _init_db_lock:
+            if self.db_path in _initialized_db_paths:
+                return
+            if self._create_schema():
+                _initialized_db_paths.add(self.db_path)
+
+    def _create_schema(self) -> bool:
         try:
             conn = sqlite3.connect(self.db_path)
             conn.execute('''
@@ -180,8 +195,10 @@ class AgentRegistry:
             ''')
             conn.commit()
             conn.close()
+            return True
         except Exception as e:
             logger.error(f"Failed to init agent_runs table: {e}")
+            return False
 
     def register(self, agent: BaseAgent):
         """Register an agent"""
@@ -271,56 +288,66 @@ class AgentRegistry:
 
     def get_cost_summary(self, days: int = 30) -> Dict[str, Any]:
         """Get cost summary across all agents"""
+        cutoff = (datetime.utcnow() - timedelta(days=days)).strftime('%Y-%m-%d %H:%M:%S')
         try:
             conn = sqlite3.connect(self.db_path)
             conn.row_factory = sqlite3.Row
 
-            # Total cost
-            row = conn.execute('''
-                SELECT
-                    COALESCE(SUM(estimated_cost), 0) as total_cost,
-                    COUNT(*) as total_runs,
-                    COALESCE(SUM(tokens_input), 0) as total_tokens_in,
-                    COALESCE(SUM(tokens_output), 0) as total_tokens_out
-                FROM agent_runs
-                WHERE created_at > datetime('now', ? || ' days')
-            ''', (f'-{days}',)).fetchone()
-
-            # Per-agent breakdown
-            agent_rows = conn.execute('''
+            # One aggregate per (agent, day), folded into the total, per-agent
+            # and per-day breakdowns in Python (previously three queries
+            # re-filtering the same rows).  tokens keeps SUM(in + out)
+            # semantics: runs with either count NULL are not included.
+            cursor = conn.execute('''
                 SELECT
                     agent_name,
-                    COUNT(*) as runs,
-                    COALESCE(SUM(estimated_cost), 0) as cost,
-                    COALESCE(SUM(tokens_input + tokens_output), 0) as tokens
-                FROM agent_runs
-                WHERE created_at > datetime('now', ? || ' days')
-                GROUP BY agent_name
-                ORDER BY cost DESC
-            ''', (f'-{days}',)).fetchall()
-
-            # Daily breakdown
-            daily_rows = conn.execute('''
-                SELECT
-                    DATE(created_at) as date,
-                    COALESCE(SUM(estimated_cost), 0) as cost,
-                    COUNT(*) as runs
+                    DATE(created_at) AS day,
+                    COUNT(*) AS runs,
+                    SUM(estimated_cost) AS cost,
+                    SUM(tokens_input) AS tokens_in,
+                    SUM(tokens_output) AS tokens_out,
+                    SUM(tokens_input + tokens_output) AS tokens
                 FROM agent_runs
-                WHERE created_at > datetime('now', ? || ' days')
-                GROUP BY DATE(created_at)
-                ORDER BY date DESC
-            ''', (f'-{days}',)).fetchall()
+                WHERE created_at > ?
+                GROUP BY agent_name, DATE(created_at)
+            ''', (cutoff,))
+
+            total_cost = 0.0
+            total_runs = 0
+            total_tokens_in = 0
+            total_tokens_out = 0
+            by_agent: Dict[str, Dict[str, Any]] = {}
+            by_day: Dict[str, Dict[str, Any]] = {}
+            for agent_name, day, runs, cost, tokens_in, tokens_out, tokens in cursor:
+                cost = cost or 0.0
+                total_cost += cost
+                total_runs += runs
+                total_tokens_in += tokens_in or 0
+                total_tokens_out += tokens_out or 0
+
+                agent = by_agent.get(agent_name)
+                if agent is None:
+                    agent = by_agent[agent_name] = {
+                        'agent_name': agent_name, 'runs': 0, 'cost': 0.0, 'tokens': 0}
+                agent['runs'] += runs
+                agent['cost'] += cost
+                agent['tokens'] += tokens or 0
+
+                daily = by_day.get(day)
+                if daily is None:
+                    daily = by_day[day] = {'date': day, 'cost': 0.0, 'runs': 0}
+                daily['cost'] += cost
+                daily['runs'] += runs
 
             conn.close()
 
             return {
                 'period_days': days,
-                'total_cost': round(row['total_cost'], 4),
-                'total_runs': row['total_runs'],
-                'total_tokens_input': row['total_tokens_in'],
-                'total_tokens_output': row['total_tokens_out'],
-                'by_agent': [dict(r) for r in agent_rows],
-                'by_day': [dict(r) for r in daily_rows],
+                'total_cost': round(total_cost, 4),
+                'total_runs': total_runs,
+                'total_tokens_input': total_tokens_in,
+                'total_tokens_output': total_tokens_out,
+                'by_agent': sorted(by_agent.values(), key=lambda a: a['cost'], reverse=True),
+                'by_day': sorted(by_day.values(), key=lambda d: d['date'], reverse=True),
             }
         except Exception as e:
             logger.error(f"Failed to get cost summary: {e}")
@@ -14,7 +14,7 @@ import requests
 
 from backend.agents.base import AgentConfig, AgentResult, BaseAgent
 from backend.config import Config
-from backend.database import get_db_connection
+from backend.database import db_session
 
 logger = logging.getLogger(__name__)
 
@@ -172,64 +172,61 @@ class DownloadTrackerAgent(BaseAgent):
         Returns:
             Number of data points stored
         """
-        conn = get_db_connection()
-        cursor = conn.cursor()
         stored_count = 0
         
         try:
-            # Store aggregate stats
-            total_uniques = clone_data.get("uniques", 0)
-            total_count = clone_data.get("count", 0)
-            
-            cursor.execute(
-                """
-                INSERT INTO download_stats (
-                    repo_owner, repo_name, total_clones, unique_clones,
-                    period_start, period_end, recorded_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    repo_owner,
-                    repo_name,
-                    total_count,
-                    total_uniques,
-                    (datetime.utcnow() - timedelta(days=14)).isoformat(),
-                    datetime.utcnow().isoformat(),
-                    datetime.utcnow().isoformat(),
-                )
-            )
-            
-            # Store daily breakdown
-            for day_data in clone_data.get("clones", []):
-                timestamp = day_data.get("timestamp", "")
-                count = day_data.get("count", 0)
-                uniques = day_data.get("uniques", 0)
+            with db_session() as conn:
+                cursor = conn.cursor()
                 
-                # Use INSERT OR REPLACE to avoid duplicates
+                # Store aggregate stats
+                total_uniques = clone_data.get("uniques", 0)
+                total_count = clone_data.get("count", 0)
+                now = datetime.utcnow()
+            
                 cursor.execute(
                     """
-                    INSERT OR REPLACE INTO download_daily (
-                        repo_owner, repo_name, date, clones, unique_clones
-                    ) VALUES (?, ?, ?, ?, ?)
+                    INSERT INTO download_stats (
+                        repo_owner, repo_name, total_clones, unique_clones,
+                        period_start, period_end, recorded_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
                     """,
                     (
                         repo_owner,
                         repo_name,
-                        timestamp[:10],  # Extract YYYY-MM-DD
-                        count,
-                        uniques,
+                        total_count,
+                        total_uniques,
+                        (now - timedelta(days=14)).isoformat(),
+                        now.isoformat(),
+                        now.isoformat(),
                     )
                 )
-                stored_count += 1
             
-            conn.commit()
+                # Store daily breakdown in one batch, same transaction as the
+                # aggregate row (INSERT OR REPLACE to avoid duplicates)
+                daily_rows = [
+                    (
+                        repo_owner,
+                        repo_name,
+                        day_data.get("timestamp", "")[:10],  # Extract YYYY-MM-DD
+                        day_data.get("count", 0),
+                        day_data.get("uniques", 0),
+                    )
+                    for day_data in clone_data.get("clones", [])
+                ]
+                cursor.executemany(
+                    """
+                    INSERT OR REPLACE INTO download_daily (
+                        repo_owner, repo_name, date, clones, unique_clones
+                    ) VALUES (?, ?, ?, ?, ?)
+                    """,
+                    daily_rows,
+                )
+                stored_count = len(daily_rows)
+            
             logger.info(f"Stored {stored_count} download data points for {repo_owner}/{repo_name}")
             
         except Exception as e:
-            conn.rollback()
             logger.error(f"Failed to store download stats: {e}")
             raise
-        finally:
-            conn.close()
         
         return stored_count
@@ -9,6 +9,7 @@ import logging
 import re
 import time
 import threading
+from functools import lru_cache
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Type
 
@@ -96,6 +97,12 @@ _NEGATIVE_KW = {
     'recession', 'bankrupt', 'fraud', 'scam', 'rug pull',
 }
 
+
+@lru_cache(maxsize=256)
+def _ticker_mention_re(ticker: str) -> "re.Pattern[str]":
+    """Compiled ``$TICKER`` / standalone ``TICKER`` pattern, built once per ticker."""
+    return re.compile(rf'\$?{re.escape(ticker)}\b')
+
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
@@ -234,6 +241,7 @@ class RedditScanner(_CrewAIBaseTool):
         data = resp.json()
         children = data.get("data", {}).get("children", [])
 
+        mention_re = _ticker_mention_re(ticker)
         posts = []
         for child in children:
             post_data = child.get("data", {})
@@ -243,7 +251,7 @@ class RedditScanner(_CrewAIBaseTool):
             # Check if the ticker is actually mentioned
             combined = f"{title} {selftext}".upper()
             # Look for $TICKER or standalone TICKER
-            if not re.search(rf'\$?{re.escape(ticker)}\b', combined):
+            if not mention_re.search(combined):
                 continue
 
             # Compute basic sentiment
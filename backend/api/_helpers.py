@@ -0,0 +1,84 @@
+"""
+TickerPulse AI v3.0 - Shared API helpers
+Response utilities used by several blueprints.
+"""
+
+import json
+import logging
+
+from flask import Response, jsonify, request
+
+from backend.database import is_db_available
+
+logger = logging.getLogger(__name__)
+
+# ------------------------------------------------------------------
+# Optional orjson serializer
+# ------------------------------------------------------------------
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+    logger.info("orjson not installed -- API responses will use the stdlib json encoder")
+
+
+def json_dumps(payload) -> str:
+    """Encode ``payload`` to a JSON string, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(payload)
+
+
+def json_response(payload, status: int = 200) -> Response:
+    """Serialize ``payload`` to a JSON response, using orjson when installed.
+
+    orjson encodes large row lists several times faster than the stdlib
+    encoder behind ``jsonify``; without it this is just ``jsonify``.
+    """
+    if not ORJSON_AVAILABLE:
+        response = jsonify(payload)
+        response.status_code = status
+        return response
+    return Response(
+        orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS),
+        status=status,
+        mimetype='application/json',
+    )
+
+
+def prerender_json(payload) -> bytes:
+    """Encode a constant ``payload`` once, for use with ``raw_json_response``."""
+    return json_dumps(payload).encode()
+
+
+def raw_json_response(body: bytes, status: int) -> Response:
+    """Wrap pre-encoded JSON ``body`` in a response without re-serializing.
+
+    Used for fixed failure bodies (413, 503) that are rendered once at import
+    time. A fresh ``Response`` is built per call since CORS and other
+    after-request hooks mutate its headers.
+    """
+    return Response(body, status=status, mimetype='application/json')
+
+
+_RESP_DB_UNAVAILABLE = prerender_json({'success': False, 'error': 'Database unavailable'})
+
+
+def require_db():
+    """``before_request`` guard: 503 while the background probe reports the DB down."""
+    if not is_db_available():
+        return raw_json_response(_RESP_DB_UNAVAILABLE, 503)
+
+
+def conditional_json(payload, max_age: int = 5):
+    """Return ``payload`` as JSON with an ETag, honouring If-None-Match.
+
+    Dashboards poll these endpoints on a fixed interval; when the data has
+    not changed the client gets an empty 304 instead of the full body.
+    """
+    response = json_response(payload)
+    response.add_etag()
+    response.headers['Cache-Control'] = f'public, max-age={max_age}'
+    return response.make_conditional(request)
@@ -7,14 +7,14 @@ not yet implemented. The route structure and response schemas are designed to
 be forward-compatible with the real agent framework.
 """
 
-from flask import Blueprint, jsonify, request
-from datetime import datetime, timedelta
-import sqlite3
+from flask import Blueprint, g, jsonify, request
+from datetime import timedelta
 import random
+import threading
 import time
 import logging
 
-from backend.config import Config
+from backend.database import get_db_connection, get_readonly_connection
 
 logger = logging.getLogger(__name__)
 
@@ -109,6 +109,116 @@ def _find_agent(name):
     return None
 
 
+# ---------------------------------------------------------------------------
+# Recent-runs SQL -- one fixed statement per filter combination, built once
+# at import and selected by bitmask (1 = agent filter, 2 = status filter,
+# 4 = explicit limit).  Without ?limit= the default is inlined as a literal.
+# ---------------------------------------------------------------------------
+
+_RUN_FILTER_AGENT = 1
+_RUN_FILTER_STATUS = 2
+_RUN_EXPLICIT_LIMIT = 4
+_RUNS_DEFAULT_LIMIT = 50
+_RUNS_MAX_LIMIT = 200
+
+
+def _build_recent_runs_sql(mask):
+    clauses = []
+    if mask & _RUN_FILTER_AGENT:
+        clauses.append('agent_name = ?')
+    if mask & _RUN_FILTER_STATUS:
+        clauses.append('status = ?')
+    where = f"WHERE {' AND '.join(clauses)} " if clauses else ''
+    limit = '?' if mask & _RUN_EXPLICIT_LIMIT else _RUNS_DEFAULT_LIMIT
+    return f'SELECT * FROM agent_runs {where}ORDER BY started_at DESC LIMIT {limit}'
+
+
+_RECENT_RUNS_SQL = {mask: _build_recent_runs_sql(mask) for mask in range(8)}
+
+
+# ---------------------------------------------------------------------------
+# Run statistics (last run, totals) for the agent list.  Cached briefly so
+# several dashboard tabs polling /api/agents share one aggregate query.
+# ---------------------------------------------------------------------------
+
+_RUN_STATS_TTL_SECONDS = 5
+_RUN_STATS_AGENT_NAMES = tuple(a['name'] for a in _STUB_AGENTS)
+_RUN_STATS_SQL = f"""
+    SELECT r.id, r.agent_name, r.status, r.started_at, r.completed_at,
+           COALESCE(r.duration_ms, 0) AS duration_ms,
+           COALESCE(r.tokens_input, 0) + COALESCE(r.tokens_output, 0) AS tokens_used,
+           COALESCE(r.estimated_cost, 0) AS estimated_cost,
+           s.total_runs, s.total_cost
+    FROM (
+        SELECT agent_name,
+               COUNT(*) AS total_runs,
+               ROUND(COALESCE(SUM(estimated_cost), 0), 4) AS total_cost,
+               MAX(started_at) AS last_started
+        FROM agent_runs
+        WHERE agent_name IN ({','.join('?' * len(_RUN_STATS_AGENT_NAMES))})
+        GROUP BY agent_name
+    ) s
+    JOIN agent_runs r
+      ON r.agent_name = s.agent_name AND r.started_at = s.last_started
+    ORDER BY r.id DESC
+"""
+_run_stats_cache = {'expires': 0.0, 'value': None}
+_run_stats_lock = threading.Lock()
+
+
+def _invalidate_run_stats():
+    """Force the next /api/agents call to re-read run statistics."""
+    _run_stats_cache['expires'] = 0.0
+
+
+def _get_run_stats():
+    """Return ``{agent_name: {last_run, total_runs, total_cost}}``."""
+    if _run_stats_cache['expires'] > time.monotonic():
+        return _run_stats_cache['value']
+    with _run_stats_lock:
+        # Another request may have refreshed while we waited
+        if _run_stats_cache['expires'] > time.monotonic():
+            return _run_stats_cache['value']
+        stats = _load_run_stats()
+        _run_stats_cache['value'] = stats
+        _run_stats_cache['expires'] = time.monotonic() + _RUN_STATS_TTL_SECONDS
+        return stats
+
+
+def _load_run_stats():
+    """One aggregate query for every agent instead of three per agent."""
+    stats = {}
+    try:
+        conn = get_readonly_connection()
+        try:
+            rows = conn.execute(_RUN_STATS_SQL, _RUN_STATS_AGENT_NAMES).fetchall()
+        finally:
+            conn.close()
+    except Exception as e:
+        logger.error(f"Failed to enrich agents with run data: {e}")
+        return stats
+
+    for row in rows:
+        # Ties on started_at: keep the newest row per agent
+        if row['agent_name'] in stats:
+            continue
+        stats[row['agent_name']] = {
+            'last_run': {
+                'id': row['id'],
+                'agent_name': row['agent_name'],
+                'status': row['status'],
+                'started_at': row['started_at'],
+                'completed_at': row['completed_at'],
+                'duration_ms': row['duration_ms'],
+                'tokens_used': row['tokens_used'],
+                'estimated_cost': row['estimated_cost'],
+            },
+            'total_runs': row['total_runs'],
+            'total_cost': row['total_cost'],
+        }
+    return stats
+
+
 # ---------------------------------------------------------------------------
 # Routes
 # ---------------------------------------------------------------------------
@@ -139,46 +249,20 @@ def list_agents():
         enabled_bool = enabled_filter.lower() == 'true'
         agents = [a for a in agents if a['enabled'] == enabled_bool]
 
-    # Enrich with last_run data from DB
-    try:
-        conn = sqlite3.connect(Config.DB_PATH)
-        conn.row_factory = sqlite3.Row
-        for agent in agents:
-            row = conn.execute(
-                'SELECT * FROM agent_runs WHERE agent_name = ? ORDER BY started_at DESC LIMIT 1',
-                (agent['name'],)
-            ).fetchone()
-            if row:
-                agent['last_run'] = {
-                    'id': row['id'],
-                    'agent_name': row['agent_name'],
-                    'status': row['status'],
-                    'started_at': row['started_at'],
-                    'completed_at': row['completed_at'],
-                    'duration_ms': row['duration_ms'] or 0,
-                    'tokens_used': (row['tokens_input'] or 0) + (row['tokens_output'] or 0),
-                    'estimated_cost': row['estimated_cost'] or 0,
-                }
-                # Update total_runs from DB
-                count = conn.execute(
-                    'SELECT COUNT(*) FROM agent_runs WHERE agent_name = ?',
-                    (agent['name'],)
-                ).fetchone()[0]
-                agent['total_runs'] = count
-                # Compute total_cost
-                total_cost = conn.execute(
-                    'SELECT COALESCE(SUM(estimated_cost), 0) FROM agent_runs WHERE agent_name = ?',
-                    (agent['name'],)
-                ).fetchone()[0]
-                agent['total_cost'] = round(total_cost, 4)
-        conn.close()
-    except Exception as e:
-        logger.error(f"Failed to enrich agents with run data: {e}")
+    # Enrich with last_run data from DB (shared across requests for a few
+    # seconds -- the dashboard polls this endpoint)
+    run_stats = _get_run_stats()
+    for agent in agents:
+        stats = run_stats.get(agent['name'])
+        if stats:
+            agent.update(stats)
 
-    return jsonify({
+    response = jsonify({
         'agents': agents,
         'total': len(agents)
     })
+    response.headers['Cache-Control'] = f'public, max-age={_RUN_STATS_TTL_SECONDS}'
+    return response
 
 
 @agents_bp.route('/agents/<name>', methods=['GET'])
@@ -247,7 +331,7 @@ def trigger_agent_run(name):
     params = data.get('params', {})
 
     # Execute a simulated agent run and store results
-    started_at = datetime.utcnow()
+    started_at = g.now_utc
     duration_ms = random.randint(800, 3500)
 
     # Generate stub output based on agent type
@@ -255,7 +339,7 @@ def trigger_agent_run(name):
 
     # Store in agent_runs table
     try:
-        conn = sqlite3.connect(Config.DB_PATH)
+        conn = get_db_connection()
         tokens_in = random.randint(100, 800)
         tokens_out = random.randint(100, 700)
         cursor = conn.execute("""
@@ -277,6 +361,7 @@ def trigger_agent_run(name):
         run_id = cursor.lastrowid
         conn.commit()
         conn.close()
+        _invalidate_run_stats()
     except Exception as e:
         logger.error(f"Failed to store agent run: {e}")
         run_id = 0
@@ -326,28 +411,27 @@ def list_recent_runs():
         - runs: Array of run summary objects.
         - total: Total count of runs returned.
     """
-    limit = min(int(request.args.get('limit', 50)), 200)
+    limit_arg = request.args.get('limit')
+    limit = _RUNS_DEFAULT_LIMIT if limit_arg is None else min(int(limit_arg), _RUNS_MAX_LIMIT)
     agent_filter = request.args.get('agent', None)
     status_filter = request.args.get('status', None)
 
     try:
-        conn = sqlite3.connect(Config.DB_PATH)
-        conn.row_factory = sqlite3.Row
+        conn = get_readonly_connection()
 
-        query = 'SELECT * FROM agent_runs WHERE 1=1'
+        mask = 0
         params = []
-
         if agent_filter:
-            query += ' AND agent_name = ?'
+            mask |= _RUN_FILTER_AGENT
             params.append(agent_filter)
         if status_filter:
-            query += ' AND status = ?'
+            mask |= _RUN_FILTER_STATUS
             params.append(status_filter)
+        if limit_arg is not None:
+            mask |= _RUN_EXPLICIT_LIMIT
+            params.append(limit)
 
-        query += ' ORDER BY started_at DESC LIMIT ?'
-        params.append(limit)
-
-        rows = conn.execute(query, params).fetchall()
+        rows = conn.execute(_RECENT_RUNS_SQL[mask], params).fetchall()
         conn.close()
 
         runs = [{
@@ -396,7 +480,7 @@ def get_cost_summary():
         }), 400
 
     # Determine date range based on period
-    now = datetime.utcnow()
+    now = g.now_utc
     if period == 'daily':
         range_start = (now - timedelta(days=1)).isoformat() + 'Z'
         range_label = 'Last 24 hours'
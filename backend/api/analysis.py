@@ -4,49 +4,66 @@ Blueprint for AI ratings and chart data endpoints.
 """
 
 from flask import Blueprint, jsonify, request
-from datetime import datetime
-import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 import logging
 
 from backend.core.ai_analytics import StockAnalytics
-from backend.config import Config
+from backend.database import get_readonly_connection
 
 logger = logging.getLogger(__name__)
 
 analysis_bp = Blueprint('analysis', __name__, url_prefix='/api')
 
+# Live rating calculation is blocking network I/O (price fetch + optional AI
+# summary).  Missing ratings are computed on this bounded pool rather than
+# one after another on the request thread.
+_RATING_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='ai-rating')
 
-def _get_cached_ratings():
-    """Try to read pre-computed ratings from ai_ratings table."""
+
+def _get_active_ratings():
+    """Read active tickers and their cached ratings in a single query.
+
+    Returns:
+        Tuple of (active tickers sorted, {ticker: cached rating dict}).
+        Tickers with no ai_ratings row are absent from the dict.
+    """
+    active_tickers = []
+    cached_map = {}
     try:
-        conn = sqlite3.connect(Config.DB_PATH)
-        conn.row_factory = sqlite3.Row
+        conn = get_readonly_connection()
         rows = conn.execute("""
-            SELECT * FROM ai_ratings ORDER BY ticker
+            SELECT s.ticker AS active_ticker, r.*
+            FROM stocks s
+            LEFT JOIN ai_ratings r ON r.ticker = s.ticker
+            WHERE s.active = 1
+            ORDER BY s.ticker
         """).fetchall()
         conn.close()
-        if rows:
-            return [
-                {
-                    'ticker': r['ticker'],
-                    'rating': r['rating'],
-                    'score': r['score'] or 0,
-                    'confidence': r['confidence'] or 0,
-                    'current_price': r['current_price'] or 0,
-                    'price_change': r['price_change'] or 0,
-                    'price_change_pct': r['price_change_pct'] or 0,
-                    'rsi': r['rsi'] or 0,
-                    'sentiment_score': r['sentiment_score'] or 0,
-                    'sentiment_label': r['sentiment_label'] or 'neutral',
-                    'technical_score': r['technical_score'] or 0,
-                    'fundamental_score': r['fundamental_score'] or 0,
-                    'updated_at': r['updated_at'],
-                }
-                for r in rows
-            ]
     except Exception as e:
         logger.debug(f"No cached ratings: {e}")
-    return None
+        return active_tickers, cached_map
+
+    for r in rows:
+        active_tickers.append(r['active_ticker'])
+        if r['ticker'] is None:
+            continue
+        cached_map[r['ticker']] = {
+            'ticker': r['ticker'],
+            'rating': r['rating'],
+            'score': r['score'] or 0,
+            'confidence': r['confidence'] or 0,
+            'current_price': r['current_price'] or 0,
+            'price_change': r['price_change'] or 0,
+            'price_change_pct': r['price_change_pct'] or 0,
+            'rsi': r['rsi'] or 0,
+            'sentiment_score': r['sentiment_score'] or 0,
+            'sentiment_label': r['sentiment_label'] or 'neutral',
+            'technical_score': r['technical_score'] or 0,
+            'fundamental_score': r['fundamental_score'] or 0,
+            'updated_at': r['updated_at'],
+        }
+    return active_tickers, cached_map
 
 
 @analysis_bp.route('/ai/ratings', methods=['GET'])
@@ -58,32 +75,20 @@ def get_ai_ratings():
     """
     analytics = StockAnalytics()
 
-    # Get all active stock tickers
-    try:
-        conn = sqlite3.connect(Config.DB_PATH)
-        conn.row_factory = sqlite3.Row
-        active_tickers = {
-            row['ticker']
-            for row in conn.execute("SELECT ticker FROM stocks WHERE active = 1").fetchall()
-        }
-        conn.close()
-    except Exception:
-        active_tickers = set()
-
-    # Try cached ratings
-    cached = _get_cached_ratings()
-    cached_map = {}
-    if cached:
-        cached_map = {r['ticker']: r for r in cached}
+    # Active tickers joined with their cached ratings (one round-trip)
+    active_tickers, cached_map = _get_active_ratings()
 
     # Find active stocks missing from cache
-    missing = active_tickers - set(cached_map.keys())
-
-    # Compute live ratings for missing stocks
-    for ticker in missing:
+    missing = [t for t in active_tickers if t not in cached_map]
+
+    # Compute live ratings for missing stocks concurrently
+    futures = {
+        ticker: _RATING_EXECUTOR.submit(analytics.calculate_ai_rating, ticker)
+        for ticker in missing
+    }
+    for ticker, future in futures.items():
         try:
-            rating = analytics.calculate_ai_rating(ticker)
-            cached_map[ticker] = rating
+            cached_map[ticker] = future.result()
         except Exception as e:
             logger.error(f"Error calculating rating for {ticker}: {e}")
             cached_map[ticker] = {
@@ -95,7 +100,7 @@ def get_ai_ratings():
             }
 
     # Return only active stocks, sorted by ticker
-    results = [cached_map[t] for t in sorted(active_tickers) if t in cached_map]
+    results = [cached_map[t] for t in active_tickers if t in cached_map]
     return jsonify(results)
 
 
@@ -104,8 +109,7 @@ def get_ai_rating(ticker):
     """Get AI rating for a specific stock."""
     # Try cached first
     try:
-        conn = sqlite3.connect(Config.DB_PATH)
-        conn.row_factory = sqlite3.Row
+        conn = get_readonly_connection()
         row = conn.execute("SELECT * FROM ai_ratings WHERE ticker = ?", (ticker.upper(),)).fetchone()
         conn.close()
         if row:
@@ -155,19 +159,18 @@ def get_chart_data(ticker):
     lows = price_data.get('low', [])
     volumes = price_data.get('volume', [])
 
-    # Create clean data points
-    data_points = []
-    for i in range(len(timestamps)):
-        if closes[i] is not None:
-            data_points.append({
-                'timestamp': timestamps[i],
-                'date': datetime.fromtimestamp(timestamps[i]).strftime('%Y-%m-%d'),
-                'open': opens[i],
-                'high': highs[i],
-                'low': lows[i],
-                'close': closes[i],
-                'volume': volumes[i]
-            })
+    # Create clean data points.  date.fromtimestamp().isoformat() yields the
+    # same YYYY-MM-DD as strftime without re-parsing a format per point.
+    data_points = [{
+        'timestamp': ts,
+        'date': date.fromtimestamp(ts).isoformat(),
+        'open': o,
+        'high': h,
+        'low': lo,
+        'close': c,
+        'volume': v
+    } for ts, o, h, lo, c, v in zip(timestamps, opens, highs, lows, closes, volumes)
+        if c is not None]
 
     if not data_points:
         return jsonify({'error': 'No valid data points'}), 404
@@ -5,7 +5,10 @@ Blueprint for the AI chat endpoint that provides conversational stock analysis.
 
 from flask import Blueprint, jsonify, request
 import logging
+import threading
+import time
 
+from backend.api._helpers import prerender_json, raw_json_response
 from backend.core.ai_analytics import StockAnalytics
 from backend.core.ai_providers import AIProviderFactory
 from backend.core.settings_manager import get_active_ai_provider
@@ -14,6 +17,41 @@ logger = logging.getLogger(__name__)
 
 chat_bp = Blueprint('chat', __name__, url_prefix='/api')
 
+_RESP_MISSING_QUESTION = prerender_json({'success': False, 'error': 'Missing ticker or question'})
+
+# ---------------------------------------------------------------------------
+# Short-lived cache of per-ticker rating context.  Follow-up questions about
+# the same ticker arrive seconds apart; recomputing the rating each time
+# refetches prices and rewrites ai_ratings for no new information.
+# ---------------------------------------------------------------------------
+
+_CONTEXT_TTL_SECONDS = 30
+_CONTEXT_MAX_ENTRIES = 1024
+_context_cache = {}  # ticker -> (expires_at, rating dict)
+_context_lock = threading.Lock()
+
+
+def _get_stock_context(ticker):
+    """Return the AI rating used as chat context, cached per ticker."""
+    key = ticker.upper()
+    now = time.monotonic()
+    with _context_lock:
+        entry = _context_cache.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+
+    rating = StockAnalytics().calculate_ai_rating(ticker)
+
+    with _context_lock:
+        if len(_context_cache) >= _CONTEXT_MAX_ENTRIES:
+            # Drop expired entries first; fall back to clearing outright
+            for k in [k for k, (exp, _) in _context_cache.items() if exp <= now]:
+                del _context_cache[k]
+            if len(_context_cache) >= _CONTEXT_MAX_ENTRIES:
+                _context_cache.clear()
+        _context_cache[key] = (now + _CONTEXT_TTL_SECONDS, rating)
+    return rating
+
 
 @chat_bp.route('/chat/ask', methods=['POST'])
 def ask_chat_endpoint():
@@ -43,12 +81,14 @@ def ask_chat_endpoint():
         500: AI provider initialization failure or generation error.
     """
     data = request.json
+    if type(data) is not dict:
+        return raw_json_response(_RESP_MISSING_QUESTION, 400)
     ticker = data.get('ticker')
     question = data.get('question')
     thinking_level = data.get('thinking_level', 'balanced')
 
     if not ticker or not question:
-        return jsonify({'success': False, 'error': 'Missing ticker or question'}), 400
+        return raw_json_response(_RESP_MISSING_QUESTION, 400)
 
     try:
         # Get active AI provider
@@ -57,8 +97,7 @@ def ask_chat_endpoint():
             return jsonify({'success': False, 'error': 'No AI provider configured'}), 400
 
         # Get current stock analysis for context
-        analytics = StockAnalytics()
-        rating = analytics.calculate_ai_rating(ticker)
+        rating = _get_stock_context(ticker)
 
         # Define thinking level instructions
         thinking_instructions = {
@@ -4,15 +4,18 @@ Endpoints for repository download statistics.
 """
 
 import logging
-from datetime import datetime, timedelta
-from flask import Blueprint, jsonify, request
+from datetime import timedelta
+from flask import Blueprint, g, jsonify, request
 
-from backend.database import get_db_connection
+from backend.api._helpers import conditional_json, require_db
+from backend.database import get_readonly_connection
 
 logger = logging.getLogger(__name__)
 
 bp = Blueprint('downloads', __name__, url_prefix='/api/downloads')
 
+bp.before_request(require_db)
+
 
 @bp.route('/stats', methods=['GET'])
 def get_download_stats():
@@ -31,39 +34,32 @@ def get_download_stats():
     limit = request.args.get('limit', 10, type=int)
     
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            """
-            SELECT 
-                id, repo_owner, repo_name, total_clones, unique_clones,
-                period_start, period_end, recorded_at
-            FROM download_stats
-            WHERE repo_owner = ? AND repo_name = ?
-            ORDER BY recorded_at DESC
-            LIMIT ?
-            """,
-            (repo_owner, repo_name, limit)
-        )
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        stats = []
-        for row in rows:
-            stats.append({
-                'id': row['id'],
-                'repo_owner': row['repo_owner'],
-                'repo_name': row['repo_name'],
-                'total_clones': row['total_clones'],
-                'unique_clones': row['unique_clones'],
-                'period_start': row['period_start'],
-                'period_end': row['period_end'],
-                'recorded_at': row['recorded_at'],
-            })
-        
-        return jsonify({
+        conn = get_readonly_connection()
+        try:
+            cursor = conn.cursor()
+        
+            cursor.execute(
+                """
+                SELECT 
+                    id, repo_owner, repo_name, total_clones, unique_clones,
+                    period_start, period_end, recorded_at
+                FROM download_stats
+                WHERE repo_owner = ? AND repo_name = ?
+                ORDER BY recorded_at DESC
+                LIMIT ?
+                """,
+                (repo_owner, repo_name, limit)
+            )
+        
+            # Build the response straight off the cursor rather than
+            # materialising a fetchall() list first; the SELECT list already
+            # names every output key, so zip rows onto cursor.description.
+            keys = [col[0] for col in cursor.description]
+            stats = [dict(zip(keys, row)) for row in cursor]
+        finally:
+            conn.close()
+        
+        return conditional_json({
             'success': True,
             'data': stats,
             'count': len(stats)
@@ -94,37 +90,30 @@ def get_daily_downloads():
     days = request.args.get('days', 30, type=int)
     
     # Calculate cutoff date
-    cutoff_date = (datetime.utcnow() - timedelta(days=days)).strftime('%Y-%m-%d')
+    cutoff_date = (g.now_utc - timedelta(days=days)).strftime('%Y-%m-%d')
     
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            """
-            SELECT 
-                repo_owner, repo_name, date, clones, unique_clones
-            FROM download_daily
-            WHERE repo_owner = ? AND repo_name = ? AND date >= ?
-            ORDER BY date DESC
-            """,
-            (repo_owner, repo_name, cutoff_date)
-        )
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        daily_stats = []
-        for row in rows:
-            daily_stats.append({
-                'repo_owner': row['repo_owner'],
-                'repo_name': row['repo_name'],
-                'date': row['date'],
-                'clones': row['clones'],
-                'unique_clones': row['unique_clones'],
-            })
-        
-        return jsonify({
+        conn = get_readonly_connection()
+        try:
+            cursor = conn.cursor()
+        
+            cursor.execute(
+                """
+                SELECT 
+                    repo_owner, repo_name, date, clones, unique_clones
+                FROM download_daily
+                WHERE repo_owner = ? AND repo_name = ? AND date >= ?
+                ORDER BY date DESC
+                """,
+                (repo_owner, repo_name, cutoff_date)
+            )
+        
+            keys = [col[0] for col in cursor.description]
+            daily_stats = [dict(zip(keys, row)) for row in cursor]
+        finally:
+            conn.close()
+        
+        return conditional_json({
             'success': True,
             'data': daily_stats,
             'count': len(daily_stats)
@@ -153,57 +142,49 @@ def get_download_summary():
     repo_name = request.args.get('repo_name', 'stockpulse-ai')
     
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Get latest aggregate stats
-        cursor.execute(
-            """
-            SELECT 
-                total_clones, unique_clones, period_start, period_end, recorded_at
-            FROM download_stats
-            WHERE repo_owner = ? AND repo_name = ?
-            ORDER BY recorded_at DESC
-            LIMIT 1
-            """,
-            (repo_owner, repo_name)
-        )
-        
-        latest_row = cursor.fetchone()
-        
-        # Get total from all daily records
-        cursor.execute(
-            """
-            SELECT 
-                SUM(clones) as total_clones,
-                SUM(unique_clones) as total_unique_clones,
-                COUNT(*) as days_tracked,
-                MIN(date) as first_date,
-                MAX(date) as last_date
-            FROM download_daily
-            WHERE repo_owner = ? AND repo_name = ?
-            """,
-            (repo_owner, repo_name)
-        )
-        
-        totals_row = cursor.fetchone()
-        
-        # Get last 7 days for trend
-        seven_days_ago = (datetime.utcnow() - timedelta(days=7)).strftime('%Y-%m-%d')
-        cursor.execute(
-            """
-            SELECT 
-                SUM(clones) as weekly_clones,
-                SUM(unique_clones) as weekly_unique_clones
-            FROM download_daily
-            WHERE repo_owner = ? AND repo_name = ? AND date >= ?
-            """,
-            (repo_owner, repo_name, seven_days_ago)
-        )
-        
-        weekly_row = cursor.fetchone()
-        
-        conn.close()
+        conn = get_readonly_connection()
+        try:
+            cursor = conn.cursor()
+        
+            # Latest snapshot, all-time totals and the 7-day trend in a single
+            # statement; totals and the weekly trend share one scan of
+            # download_daily (a primary-key range scan) via conditional sums.
+            seven_days_ago = (g.now_utc - timedelta(days=7)).strftime('%Y-%m-%d')
+            cursor.execute(
+                """
+                WITH latest AS (
+                    SELECT 
+                        total_clones AS latest_total_clones,
+                        unique_clones AS latest_unique_clones,
+                        period_start, period_end, recorded_at
+                    FROM download_stats
+                    WHERE repo_owner = ? AND repo_name = ?
+                    ORDER BY recorded_at DESC
+                    LIMIT 1
+                ),
+                daily AS (
+                    SELECT 
+                        SUM(clones) as total_clones,
+                        SUM(unique_clones) as total_unique_clones,
+                        COUNT(*) as days_tracked,
+                        MIN(date) as first_date,
+                        MAX(date) as last_date,
+                        SUM(CASE WHEN date >= ? THEN clones END) as weekly_clones,
+                        SUM(CASE WHEN date >= ? THEN unique_clones END) as weekly_unique_clones
+                    FROM download_daily
+                    WHERE repo_owner = ? AND repo_name = ?
+                )
+                SELECT latest.*, daily.*
+                FROM daily
+                LEFT JOIN latest ON 1 = 1
+                """,
+                (repo_owner, repo_name, seven_days_ago, seven_days_ago,
+                 repo_owner, repo_name)
+            )
+        
+            row = cursor.fetchone()
+        finally:
+            conn.close()
         
         summary = {
             'repo': f"{repo_owner}/{repo_name}",
@@ -212,31 +193,31 @@ def get_download_summary():
             'weekly': None,
         }
         
-        if latest_row:
+        if row['recorded_at'] is not None:
             summary['latest'] = {
-                'total_clones': latest_row['total_clones'],
-                'unique_clones': latest_row['unique_clones'],
-                'period_start': latest_row['period_start'],
-                'period_end': latest_row['period_end'],
-                'recorded_at': latest_row['recorded_at'],
+                'total_clones': row['latest_total_clones'],
+                'unique_clones': row['latest_unique_clones'],
+                'period_start': row['period_start'],
+                'period_end': row['period_end'],
+                'recorded_at': row['recorded_at'],
             }
         
-        if totals_row and totals_row['total_clones']:
+        if row['total_clones']:
             summary['totals'] = {
-                'total_clones': totals_row['total_clones'] or 0,
-                'total_unique_clones': totals_row['total_unique_clones'] or 0,
-                'days_tracked': totals_row['days_tracked'] or 0,
-                'first_date': totals_row['first_date'],
-                'last_date': totals_row['last_date'],
+                'total_clones': row['total_clones'] or 0,
+                'total_unique_clones': row['total_unique_clones'] or 0,
+                'days_tracked': row['days_tracked'] or 0,
+                'first_date': row['first_date'],
+                'last_date': row['last_date'],
             }
         
-        if weekly_row and weekly_row['weekly_clones']:
+        if row['weekly_clones']:
             summary['weekly'] = {
-                'clones': weekly_row['weekly_clones'] or 0,
-                'unique_clones': weekly_row['weekly_unique_clones'] or 0,
+                'clones': row['weekly_clones'] or 0,
+                'unique_clones': row['weekly_unique_clones'] or 0,
             }
         
-        return jsonify({
+        return conditional_json({
             'success': True,
             'data': summary
         })
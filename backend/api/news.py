@@ -3,15 +3,104 @@ TickerPulse AI v3.0 - News API Routes
 Blueprint for news articles, alerts, and statistics endpoints.
 """
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, g, request
+from datetime import timedelta
 import logging
+import threading
+import time
 
-from backend.database import get_db_connection
+from backend.api._helpers import conditional_json, require_db
+from backend.database import get_readonly_connection
 
 logger = logging.getLogger(__name__)
 
 news_bp = Blueprint('news', __name__, url_prefix='/api')
 
+# /api/stats is polled by every open dashboard; the 24h aggregates are
+# shared across requests for a few seconds, keyed by market filter.
+_STATS_TTL_SECONDS = 10
+_STATS_MAX_ENTRIES = 32
+_stats_cache = {}  # market (None = all) -> (expires_at, payload)
+_stats_lock = threading.Lock()
+
+# ---------------------------------------------------------------------------
+# SQL -- hot-path statements, built once at import time
+# ---------------------------------------------------------------------------
+
+# Column order of the news/alert/stats SELECTs below; rows are zipped straight
+# onto these keys instead of indexing sqlite3.Row by name per field.
+_NEWS_COLUMNS = (
+    'id', 'ticker', 'title', 'description', 'url', 'source',
+    'published_date', 'sentiment_score', 'sentiment_label', 'created_at',
+)
+_ALERT_COLUMNS = (
+    'id', 'ticker', 'alert_type', 'message', 'created_at',
+    'title', 'url', 'source', 'sentiment_score',
+)
+_STATS_COLUMNS = (
+    'ticker', 'total_articles', 'positive_count', 'negative_count',
+    'neutral_count', 'avg_sentiment',
+)
+
+_NEWS_BY_TICKER_SQL = """
+    SELECT id, ticker, title, description, url, source,
+           published_date, sentiment_score, sentiment_label, created_at
+    FROM news
+    WHERE ticker = ?
+    ORDER BY created_at DESC
+    LIMIT 50
+"""
+
+_NEWS_RECENT_SQL = """
+    SELECT id, ticker, title, description, url, source,
+           published_date, sentiment_score, sentiment_label, created_at
+    FROM news
+    ORDER BY created_at DESC
+    LIMIT 100
+"""
+
+_ALERTS_RECENT_SQL = """
+    SELECT a.id, a.ticker, a.alert_type, a.message, a.created_at,
+           n.title, n.url, n.source, n.sentiment_score
+    FROM alerts a
+    LEFT JOIN news n ON a.news_id = n.id
+    ORDER BY a.created_at DESC
+    LIMIT 50
+"""
+
+_STATS_BY_MARKET_SQL = """
+    SELECT
+        n.ticker,
+        COUNT(*) as total_articles,
+        SUM(CASE WHEN n.sentiment_label = 'positive' THEN 1 ELSE 0 END) as positive_count,
+        SUM(CASE WHEN n.sentiment_label = 'negative' THEN 1 ELSE 0 END) as negative_count,
+        SUM(CASE WHEN n.sentiment_label = 'neutral' THEN 1 ELSE 0 END) as neutral_count,
+        COALESCE(ROUND(AVG(n.sentiment_score), 2), 0) as avg_sentiment
+    FROM news n
+    INNER JOIN stocks s ON n.ticker = s.ticker
+    WHERE n.created_at > ?
+        AND s.market = ?
+    GROUP BY n.ticker
+"""
+
+_STATS_ALL_SQL = """
+    SELECT
+        ticker,
+        COUNT(*) as total_articles,
+        SUM(CASE WHEN sentiment_label = 'positive' THEN 1 ELSE 0 END) as positive_count,
+        SUM(CASE WHEN sentiment_label = 'negative' THEN 1 ELSE 0 END) as negative_count,
+        SUM(CASE WHEN sentiment_label = 'neutral' THEN 1 ELSE 0 END) as neutral_count,
+        COALESCE(ROUND(AVG(sentiment_score), 2), 0) as avg_sentiment
+    FROM news
+    WHERE created_at > ?
+    GROUP BY ticker
+"""
+
+_ALERT_COUNT_SQL = 'SELECT COUNT(*) as count FROM alerts WHERE created_at > ?'
+
+
+news_bp.before_request(require_db)
+
 
 @news_bp.route('/news', methods=['GET'])
 def get_news():
@@ -25,38 +114,20 @@ def get_news():
     """
     ticker = request.args.get('ticker', None)
 
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    conn = get_readonly_connection()
+    try:
+        cursor = conn.cursor()
 
-    if ticker:
-        cursor.execute('''
-            SELECT * FROM news
-            WHERE ticker = ?
-            ORDER BY created_at DESC
-            LIMIT 50
-        ''', (ticker,))
-    else:
-        cursor.execute('''
-            SELECT * FROM news
-            ORDER BY created_at DESC
-            LIMIT 100
-        ''')
-
-    news = cursor.fetchall()
-    conn.close()
-
-    return jsonify([{
-        'id': article['id'],
-        'ticker': article['ticker'],
-        'title': article['title'],
-        'description': article['description'],
-        'url': article['url'],
-        'source': article['source'],
-        'published_date': article['published_date'],
-        'sentiment_score': article['sentiment_score'],
-        'sentiment_label': article['sentiment_label'],
-        'created_at': article['created_at']
-    } for article in news])
+        if ticker:
+            cursor.execute(_NEWS_BY_TICKER_SQL, (ticker,))
+        else:
+            cursor.execute(_NEWS_RECENT_SQL)
+
+        news = [dict(zip(_NEWS_COLUMNS, row)) for row in cursor]
+    finally:
+        conn.close()
+
+    return conditional_json(news)
 
 
 @news_bp.route('/alerts', methods=['GET'])
@@ -66,31 +137,17 @@ def get_alerts():
     Returns:
         JSON array of alert objects joined with their associated news articles.
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    cursor.execute('''
-        SELECT a.*, n.title, n.url, n.source, n.sentiment_score
-        FROM alerts a
-        LEFT JOIN news n ON a.news_id = n.id
-        ORDER BY a.created_at DESC
-        LIMIT 50
-    ''')
-
-    alerts = cursor.fetchall()
-    conn.close()
-
-    return jsonify([{
-        'id': alert['id'],
-        'ticker': alert['ticker'],
-        'alert_type': alert['alert_type'],
-        'message': alert['message'],
-        'created_at': alert['created_at'],
-        'title': alert['title'],
-        'url': alert['url'],
-        'source': alert['source'],
-        'sentiment_score': alert['sentiment_score']
-    } for alert in alerts])
+    conn = get_readonly_connection()
+    try:
+        cursor = conn.cursor()
+
+        cursor.execute(_ALERTS_RECENT_SQL)
+
+        alerts = [dict(zip(_ALERT_COLUMNS, row)) for row in cursor]
+    finally:
+        conn.close()
+
+    return conditional_json(alerts)
 
 
 @news_bp.route('/stats', methods=['GET'])
@@ -104,55 +161,51 @@ def get_stats():
         JSON object with 'stocks' array (per-ticker stats) and 'total_alerts_24h' count.
     """
     market = request.args.get('market', None)
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    # Get stats for each stock with market filter
-    if market and market != 'All':
-        cursor.execute('''
-            SELECT
-                n.ticker,
-                COUNT(*) as total_articles,
-                SUM(CASE WHEN n.sentiment_label = 'positive' THEN 1 ELSE 0 END) as positive_count,
-                SUM(CASE WHEN n.sentiment_label = 'negative' THEN 1 ELSE 0 END) as negative_count,
-                SUM(CASE WHEN n.sentiment_label = 'neutral' THEN 1 ELSE 0 END) as neutral_count,
-                AVG(n.sentiment_score) as avg_sentiment
-            FROM news n
-            INNER JOIN stocks s ON n.ticker = s.ticker
-            WHERE n.created_at > datetime('now', '-24 hours')
-                AND s.market = ?
-            GROUP BY n.ticker
-        ''', (market,))
+    key = market if market and market != 'All' else None
+
+    now = time.monotonic()
+    with _stats_lock:
+        entry = _stats_cache.get(key)
+    if entry and entry[0] > now:
+        payload, cache_status = entry[1], 'HIT'
     else:
-        cursor.execute('''
-            SELECT
-                ticker,
-                COUNT(*) as total_articles,
-                SUM(CASE WHEN sentiment_label = 'positive' THEN 1 ELSE 0 END) as positive_count,
-                SUM(CASE WHEN sentiment_label = 'negative' THEN 1 ELSE 0 END) as negative_count,
-                SUM(CASE WHEN sentiment_label = 'neutral' THEN 1 ELSE 0 END) as neutral_count,
-                AVG(sentiment_score) as avg_sentiment
-            FROM news
-            WHERE created_at > datetime('now', '-24 hours')
-            GROUP BY ticker
-        ''')
-
-    stats = cursor.fetchall()
-
-    # Get total alerts count
-    cursor.execute('SELECT COUNT(*) as count FROM alerts WHERE created_at > datetime("now", "-24 hours")')
-    alert_count = cursor.fetchone()['count']
-
-    conn.close()
-
-    return jsonify({
-        'stocks': [{
-            'ticker': stat['ticker'],
-            'total_articles': stat['total_articles'],
-            'positive_count': stat['positive_count'],
-            'negative_count': stat['negative_count'],
-            'neutral_count': stat['neutral_count'],
-            'avg_sentiment': round(stat['avg_sentiment'], 2) if stat['avg_sentiment'] else 0
-        } for stat in stats],
+        payload, cache_status = _load_stats(key), 'MISS'
+        with _stats_lock:
+            if len(_stats_cache) >= _STATS_MAX_ENTRIES:
+                _stats_cache.clear()
+            _stats_cache[key] = (now + _STATS_TTL_SECONDS, payload)
+
+    response = conditional_json(payload)
+    response.headers['X-Cache'] = cache_status
+    return response
+
+
+def _load_stats(market):
+    """Run the 24h sentiment aggregation (``market`` None means all markets)."""
+    # Bound cutoff (same text format as CURRENT_TIMESTAMP) so the comparison
+    # is a plain range scan on the created_at indexes.
+    cutoff = (g.now_utc - timedelta(hours=24)).strftime('%Y-%m-%d %H:%M:%S')
+    conn = get_readonly_connection()
+    try:
+        cursor = conn.cursor()
+
+        # Get stats for each stock with market filter
+        if market:
+            cursor.execute(_STATS_BY_MARKET_SQL, (cutoff, market))
+        else:
+            cursor.execute(_STATS_ALL_SQL, (cutoff,))
+
+        # avg_sentiment is already rounded and NULL-coalesced by the query.
+        stocks = [dict(zip(_STATS_COLUMNS, row)) for row in cursor]
+
+        # Get total alerts count
+        cursor.execute(_ALERT_COUNT_SQL, (cutoff,))
+        alert_count = cursor.fetchone()['count']
+
+    finally:
+        conn.close()
+
+    return {
+        'stocks': stocks,
         'total_alerts_24h': alert_count
-    })
+    }
@@ -5,16 +5,143 @@ Blueprint for AI-generated research briefs.
 
 from flask import Blueprint, jsonify, request
 from datetime import datetime, timezone
-import sqlite3
 import random
+import string
 import logging
 
-from backend.config import Config
+from backend.database import get_db_connection, get_readonly_connection
 
 logger = logging.getLogger(__name__)
 
 research_bp = Blueprint('research', __name__, url_prefix='/api')
 
+# Brief listing SQL keyed by (ticker filter present, explicit limit given).
+# Without ?limit= the default is inlined as a literal and nothing is bound.
+_BRIEFS_DEFAULT_LIMIT = 50
+_BRIEFS_MAX_LIMIT = 200
+_LIST_BRIEFS_SQL = {
+    (False, False): f'SELECT * FROM research_briefs ORDER BY created_at DESC LIMIT {_BRIEFS_DEFAULT_LIMIT}',
+    (True, False): f'SELECT * FROM research_briefs WHERE ticker = ? ORDER BY created_at DESC LIMIT {_BRIEFS_DEFAULT_LIMIT}',
+    (False, True): 'SELECT * FROM research_briefs ORDER BY created_at DESC LIMIT ?',
+    (True, True): 'SELECT * FROM research_briefs WHERE ticker = ? ORDER BY created_at DESC LIMIT ?',
+}
+
+
+# ---------------------------------------------------------------------------
+# Sample brief templates -- split into literal/field segments once at import
+# so generating a brief is a plain join instead of re-parsing format strings
+# (and building every template just to pick one).
+# ---------------------------------------------------------------------------
+
+_BRIEF_TEMPLATES = [
+    (
+        '{ticker} Deep Dive: Technical & Fundamental Analysis',
+        """## Executive Summary
+
+{ticker} presents an interesting setup for investors. {price_info}. {rating_info}.
+
+## Technical Analysis
+
+The stock's RSI is currently in a neutral zone, suggesting neither overbought nor oversold conditions. Key moving averages remain supportive of the current trend.
+
+**Key Levels:**
+- Support: Recent consolidation zone provides strong support
+- Resistance: Previous highs form a key resistance area
+- Volume: Trading volume has been consistent with the 20-day average
+
+## Fundamental Overview
+
+The company continues to demonstrate solid fundamentals:
+- Revenue growth trajectory remains intact
+- Margins are stable or expanding
+- Balance sheet strength provides a buffer against market volatility
+
+## Sentiment Analysis
+
+Market sentiment for {ticker} is currently leaning positive based on:
+- News flow has been constructive
+- Social media mentions show growing interest
+- Institutional positioning appears favorable
+
+## Risk Factors
+
+- Broader market volatility could impact near-term performance
+- Sector rotation could create headwinds
+- Macroeconomic uncertainty remains elevated
+
+## Conclusion
+
+{ticker} warrants continued monitoring. The technical setup combined with solid fundamentals suggests a constructive outlook, though investors should remain mindful of broader market risks.""",
+    ),
+    (
+        '{ticker} Research Brief: Market Position & Outlook',
+        """## Overview
+
+This research brief examines {ticker}'s current market position and near-term outlook. {price_info}. {rating_info}.
+
+## Market Context
+
+The broader market environment continues to be shaped by:
+- Federal Reserve monetary policy expectations
+- Earnings season dynamics
+- Geopolitical considerations
+
+## Company Analysis
+
+### Strengths
+- Strong competitive moat in core business segments
+- Consistent execution on strategic initiatives
+- Robust cash flow generation
+
+### Catalysts
+- Upcoming product launches or earnings reports
+- Industry tailwinds in key growth segments
+- Potential for margin expansion
+
+## Technical Picture
+
+The chart pattern suggests the stock is in a consolidation phase after recent moves. Key technical indicators:
+- RSI: Moderate levels suggest room for movement in either direction
+- MACD: Signal line positioning will be crucial for near-term direction
+- Moving Averages: Price relationship with key MAs remains constructive
+
+## Social Sentiment
+
+Reddit and social media analysis indicates:
+- Moderate but growing retail interest
+- Discussion sentiment is predominantly constructive
+- No unusual options activity flagged
+
+## Investment Thesis
+
+{ticker} offers a balanced risk-reward profile at current levels. The combination of solid fundamentals, constructive technicals, and positive sentiment provides a supportive backdrop for the stock.""",
+    ),
+]
+
+_FORMATTER = string.Formatter()
+
+
+def _compile_template(text):
+    """Split a ``{field}`` template into ``(literal, field_or_None)`` pairs."""
+    return tuple(
+        (literal, field)
+        for literal, field, _spec, _conv in _FORMATTER.parse(text)
+    )
+
+
+def _expand_template(segments, values):
+    """Fill compiled segments from ``values`` (field name -> str)."""
+    return ''.join(
+        literal + values[field] if field else literal
+        for literal, field in segments
+    )
+
+
+_BRIEF_SEGMENTS = [
+    (_compile_template(title), _compile_template(content))
+    for title, content in _BRIEF_TEMPLATES
+]
+
 
 @research_bp.route('/research/briefs', methods=['GET'])
 def list_briefs():
@@ -28,22 +155,16 @@ def list_briefs():
         JSON array of research brief objects.
     """
     ticker = request.args.get('ticker', None)
-    limit = min(int(request.args.get('limit', 50)), 200)
+    limit_arg = request.args.get('limit')
+    limit = None if limit_arg is None else min(int(limit_arg), _BRIEFS_MAX_LIMIT)
 
     try:
-        conn = sqlite3.connect(Config.DB_PATH)
-        conn.row_factory = sqlite3.Row
-
-        if ticker:
-            rows = conn.execute(
-                'SELECT * FROM research_briefs WHERE ticker = ? ORDER BY created_at DESC LIMIT ?',
-                (ticker.upper(), limit)
-            ).fetchall()
-        else:
-            rows = conn.execute(
-                'SELECT * FROM research_briefs ORDER BY created_at DESC LIMIT ?',
-                (limit,)
-            ).fetchall()
+        conn = get_readonly_connection()
+
+        params = (ticker.upper(),) if ticker else ()
+        if limit is not None:
+            params += (limit,)
+        rows = conn.execute(_LIST_BRIEFS_SQL[bool(ticker), limit is not None], params).fetchall()
         conn.close()
 
         briefs = [{
@@ -78,8 +199,7 @@ def generate_brief():
     if not ticker:
         # Pick a random ticker from the watchlist
         try:
-            conn = sqlite3.connect(Config.DB_PATH)
-            conn.row_factory = sqlite3.Row
+            conn = get_readonly_connection()
             rows = conn.execute('SELECT ticker FROM stocks WHERE active = 1').fetchall()
             conn.close()
             if rows:
@@ -96,121 +216,36 @@ def generate_brief():
 def _generate_sample_brief(ticker: str) -> dict:
     """Generate and store a sample research brief for a given ticker."""
 
-    # Get current price and rating data if available
+    # Get current price and rating data if available -- both come from the
+    # cached ai_ratings row (stocks has no price columns), so one lookup.
     price_info = ''
     rating_info = ''
     try:
-        conn = sqlite3.connect(Config.DB_PATH)
-        conn.row_factory = sqlite3.Row
-
-        stock = conn.execute(
-            'SELECT current_price, price_change_pct FROM stocks WHERE ticker = ?',
-            (ticker,)
-        ).fetchone()
-        if stock and stock['current_price']:
-            price_info = f"Currently trading at ${stock['current_price']:.2f} ({stock['price_change_pct']:+.2f}%)"
+        conn = get_readonly_connection()
 
         rating = conn.execute(
-            'SELECT rating, score, rsi, sentiment_score, sentiment_label, technical_score, fundamental_score FROM ai_ratings WHERE ticker = ?',
+            'SELECT rating, score, current_price, price_change_pct FROM ai_ratings WHERE ticker = ?',
             (ticker,)
         ).fetchone()
+        conn.close()
+
         if rating:
+            if rating['current_price']:
+                price_info = f"Currently trading at ${rating['current_price']:.2f} ({rating['price_change_pct'] or 0:+.2f}%)"
             rating_info = f"AI Rating: {rating['rating']} (Score: {rating['score']}/10)"
-
-        conn.close()
     except Exception:
         pass
 
-    templates = [
-        {
-            'title': f'{ticker} Deep Dive: Technical & Fundamental Analysis',
-            'content': f"""## Executive Summary
-
-{ticker} presents an interesting setup for investors. {price_info}. {rating_info}.
-
-## Technical Analysis
-
-The stock's RSI is currently in a neutral zone, suggesting neither overbought nor oversold conditions. Key moving averages remain supportive of the current trend.
-
-**Key Levels:**
-- Support: Recent consolidation zone provides strong support
-- Resistance: Previous highs form a key resistance area
-- Volume: Trading volume has been consistent with the 20-day average
-
-## Fundamental Overview
-
-The company continues to demonstrate solid fundamentals:
-- Revenue growth trajectory remains intact
-- Margins are stable or expanding
-- Balance sheet strength provides a buffer against market volatility
-
-## Sentiment Analysis
-
-Market sentiment for {ticker} is currently leaning positive based on:
-- News flow has been constructive
-- Social media mentions show growing interest
-- Institutional positioning appears favorable
-
-## Risk Factors
-
-- Broader market volatility could impact near-term performance
-- Sector rotation could create headwinds
-- Macroeconomic uncertainty remains elevated
-
-## Conclusion
-
-{ticker} warrants continued monitoring. The technical setup combined with solid fundamentals suggests a constructive outlook, though investors should remain mindful of broader market risks.""",
-        },
-        {
-            'title': f'{ticker} Research Brief: Market Position & Outlook',
-            'content': f"""## Overview
-
-This research brief examines {ticker}'s current market position and near-term outlook. {price_info}. {rating_info}.
-
-## Market Context
-
-The broader market environment continues to be shaped by:
-- Federal Reserve monetary policy expectations
-- Earnings season dynamics
-- Geopolitical considerations
-
-## Company Analysis
-
-### Strengths
-- Strong competitive moat in core business segments
-- Consistent execution on strategic initiatives
-- Robust cash flow generation
-
-### Catalysts
-- Upcoming product launches or earnings reports
-- Industry tailwinds in key growth segments
-- Potential for margin expansion
-
-## Technical Picture
-
-The chart pattern suggests the stock is in a consolidation phase after recent moves. Key technical indicators:
-- RSI: Moderate levels suggest room for movement in either direction
-- MACD: Signal line positioning will be crucial for near-term direction
-- Moving Averages: Price relationship with key MAs remains constructive
-
-## Social Sentiment
-
-Reddit and social media analysis indicates:
-- Moderate but growing retail interest
-- Discussion sentiment is predominantly constructive
-- No unusual options activity flagged
-
-## Investment Thesis
-
-{ticker} offers a balanced risk-reward profile at current levels. The combination of solid fundamentals, constructive technicals, and positive sentiment provides a supportive backdrop for the stock.""",
-        },
-    ]
-
-    template = random.choice(templates)
+    title_segments, content_segments = random.choice(_BRIEF_SEGMENTS)
+    values = {'ticker': ticker, 'price_info': price_info, 'rating_info': rating_info}
+    template = {
+        'title': _expand_template(title_segments, values),
+        'content': _expand_template(content_segments, values),
+    }
     now = datetime.now(timezone.utc).isoformat()
 
     try:
-        conn = sqlite3.connect(Config.DB_PATH)
+        conn = get_db_connection()
         cursor = conn.execute(
             """INSERT INTO research_briefs
                (ticker, title, content, agent_name, model_used, created_at)
@@ -9,17 +9,31 @@ Blueprint prefix: /api/scheduler
 import logging
 from flask import Blueprint, jsonify, request
 
+from backend.api._helpers import json_response, prerender_json, raw_json_response
 from backend.jobs._helpers import get_job_history
 
 logger = logging.getLogger(__name__)
 
 scheduler_bp = Blueprint('scheduler_routes', __name__, url_prefix='/api/scheduler')
 
+_VALID_TRIGGERS = ('cron', 'interval', 'date')
+_VALID_TRIGGERS_TEXT = ', '.join(_VALID_TRIGGERS)
+_RESP_MISSING_TRIGGER = prerender_json({
+    'success': False,
+    'error': 'Request body must include "trigger" (cron or interval).',
+})
+
+
+_scheduler_manager = None
+
 
 def _get_scheduler_manager():
-    """Lazily import the module-level SchedulerManager singleton."""
-    from backend.scheduler import scheduler_manager
-    return scheduler_manager
+    """Lazily import the module-level SchedulerManager singleton (bound once)."""
+    global _scheduler_manager
+    if _scheduler_manager is None:
+        from backend.scheduler import scheduler_manager
+        _scheduler_manager = scheduler_manager
+    return _scheduler_manager
 
 
 # -----------------------------------------------------------------------
@@ -108,15 +122,33 @@ def trigger_job(job_id):
 
     Returns:
         JSON object with ``success`` boolean.
+
+    Errors:
+        400: Unknown job or the run could not be queued.
+        409: The job is already queued or running from a manual trigger.
+        503: Too many manual runs already pending; retry later.
     """
+    from backend.scheduler import TriggerResult
+
     sm = _get_scheduler_manager()
-    success = sm.trigger_job(job_id)
-    if success:
+    result = sm.trigger_job(job_id)
+    if result is TriggerResult.TRIGGERED:
         return jsonify({
             'success': True,
             'job_id': job_id,
             'message': f'Job {job_id} triggered for immediate execution.',
         })
+    if result is TriggerResult.QUEUE_FULL:
+        return jsonify({
+            'success': False,
+            'error': 'Too many manual job runs pending, try again shortly.',
+            'queue_depth': sm.manual_queue_depth(),
+        }), 503
+    if result is TriggerResult.ALREADY_RUNNING:
+        return jsonify({
+            'success': False,
+            'error': f'Job {job_id} is already queued or running.',
+        }), 409
     return jsonify({'success': False, 'error': f'Failed to trigger job: {job_id}'}), 400
 
 
@@ -142,18 +174,14 @@ def update_schedule(job_id):
         JSON object with ``success`` boolean.
     """
     data = request.get_json(silent=True)
-    if not data or 'trigger' not in data:
-        return jsonify({
-            'success': False,
-            'error': 'Request body must include "trigger" (cron or interval).',
-        }), 400
+    if type(data) is not dict or 'trigger' not in data:
+        return raw_json_response(_RESP_MISSING_TRIGGER, 400)
 
     trigger = data.pop('trigger')
-    valid_triggers = ('cron', 'interval', 'date')
-    if trigger not in valid_triggers:
+    if trigger not in _VALID_TRIGGERS:
         return jsonify({
             'success': False,
-            'error': f'Invalid trigger type: {trigger}. Must be one of: {", ".join(valid_triggers)}',
+            'error': f'Invalid trigger type: {trigger}. Must be one of: {_VALID_TRIGGERS_TEXT}',
         }), 400
 
     sm = _get_scheduler_manager()
@@ -186,7 +214,7 @@ def job_execution_history():
     limit = min(int(request.args.get('limit', 50)), 200)
 
     history = get_job_history(job_id=job_id, limit=limit)
-    return jsonify({
+    return json_response({
         'history': history,
         'total': len(history),
         'filters': {
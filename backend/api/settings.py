@@ -6,6 +6,7 @@ Blueprint for AI provider settings, data provider settings, and agent framework
 from flask import Blueprint, jsonify, request
 import logging
 
+from backend.api._helpers import prerender_json, raw_json_response
 from backend.core.settings_manager import (
     get_all_ai_providers,
     add_ai_provider,
@@ -18,6 +19,82 @@ logger = logging.getLogger(__name__)
 
 settings_bp = Blueprint('settings', __name__, url_prefix='/api')
 
+# ---------------------------------------------------------------------------
+# Static provider catalogues -- built once at import, not on every request.
+# ---------------------------------------------------------------------------
+
+# All supported AI providers with their available models
+_SUPPORTED_AI_PROVIDERS = {
+    'anthropic': {
+        'display_name': 'Anthropic',
+        'models': ['claude-sonnet-4-5-20250929', 'claude-haiku-4-5-20251001', 'claude-opus-4-6'],
+    },
+    'openai': {
+        'display_name': 'OpenAI',
+        'models': ['gpt-4o', 'gpt-4.1', 'gpt-4o-mini'],
+    },
+    'google': {
+        'display_name': 'Google AI',
+        'models': ['gemini-2.5-flash', 'gemini-2.5-pro'],
+    },
+    'xai': {
+        'display_name': 'xAI',
+        'models': ['grok-4', 'grok-4-vision'],
+    },
+}
+
+# Fields every AI provider POST body must carry
+_AI_PROVIDER_REQUIRED_FIELDS = frozenset({'provider', 'api_key'})
+
+# Fixed validation-failure bodies, encoded once at import
+_RESP_MISSING_PROVIDER_FIELDS = prerender_json(
+    {'success': False, 'error': 'Missing required fields: provider, api_key'})
+_RESP_MISSING_PROVIDER_ID = prerender_json(
+    {'success': False, 'error': 'Missing required field: provider_id'})
+_RESP_MISSING_FRAMEWORK = prerender_json(
+    {'success': False, 'error': 'Missing required field: framework'})
+
+# Built-in data providers with default status (stub until the data provider
+# subsystem is implemented)
+_STUB_DATA_PROVIDERS = [
+    {
+        'id': 'yahoo_finance',
+        'name': 'Yahoo Finance',
+        'type': 'market_data',
+        'status': 'active',
+        'is_default': True,
+        'requires_api_key': False,
+        'config': {}
+    },
+    {
+        'id': 'alpha_vantage',
+        'name': 'Alpha Vantage',
+        'type': 'market_data',
+        'status': 'unconfigured',
+        'is_default': False,
+        'requires_api_key': True,
+        'config': {}
+    },
+    {
+        'id': 'finnhub',
+        'name': 'Finnhub',
+        'type': 'market_data',
+        'status': 'unconfigured',
+        'is_default': False,
+        'requires_api_key': True,
+        'config': {}
+    },
+    {
+        'id': 'newsapi',
+        'name': 'NewsAPI',
+        'type': 'news',
+        'status': 'unconfigured',
+        'is_default': False,
+        'requires_api_key': True,
+        'config': {}
+    },
+]
+
 
 # ---------------------------------------------------------------------------
 # AI Provider endpoints (migrated from dashboard.py)
@@ -31,33 +108,13 @@ def get_ai_providers_endpoint():
         JSON array of provider objects with name, display_name, configured,
         models list, and default_model. API keys are never exposed.
     """
-    # All supported providers with their available models
-    SUPPORTED_PROVIDERS = {
-        'anthropic': {
-            'display_name': 'Anthropic',
-            'models': ['claude-sonnet-4-5-20250929', 'claude-haiku-4-5-20251001', 'claude-opus-4-6'],
-        },
-        'openai': {
-            'display_name': 'OpenAI',
-            'models': ['gpt-4o', 'gpt-4.1', 'gpt-4o-mini'],
-        },
-        'google': {
-            'display_name': 'Google AI',
-            'models': ['gemini-2.5-flash', 'gemini-2.5-pro'],
-        },
-        'xai': {
-            'display_name': 'xAI',
-            'models': ['grok-4', 'grok-4-vision'],
-        },
-    }
-
     # Get configured providers from DB
     configured_rows = get_all_ai_providers()
     configured_map = {row['provider_name']: row for row in configured_rows}
 
     # Build response with all providers
     result = []
-    for provider_id, info in SUPPORTED_PROVIDERS.items():
+    for provider_id, info in _SUPPORTED_AI_PROVIDERS.items():
         db_row = configured_map.get(provider_id)
         result.append({
             'name': provider_id,
@@ -85,8 +142,8 @@ def add_ai_provider_endpoint():
         JSON object with 'success' boolean.
     """
     data = request.json
-    if not data or 'provider' not in data or 'api_key' not in data:
-        return jsonify({'success': False, 'error': 'Missing required fields: provider, api_key'}), 400
+    if type(data) is not dict or _AI_PROVIDER_REQUIRED_FIELDS.difference(data):
+        return raw_json_response(_RESP_MISSING_PROVIDER_FIELDS, 400)
 
     success = add_ai_provider(
         data['provider'],
@@ -135,38 +192,18 @@ def test_stored_ai_provider(provider_name):
     Returns:
         JSON object with 'success' boolean and provider info.
     """
-    from backend.core.settings_manager import get_active_ai_provider, get_all_ai_providers
-
-    # Find the stored provider
-    providers = get_all_ai_providers()
-    stored = None
-    for p in providers:
-        if p['provider_name'] == provider_name:
-            stored = p
-            break
+    from backend.core.settings_manager import get_ai_provider
 
+    # Single lookup by name -- returns the API key too, so no second query
+    stored = get_ai_provider(provider_name)
     if not stored:
         return jsonify({
             'success': False,
             'error': f'Provider "{provider_name}" is not configured. Add an API key first.'
         })
 
-    # Get the full provider record (with API key) from DB
-    import sqlite3
-    from backend.config import Config
     try:
-        conn = sqlite3.connect(Config.DB_PATH)
-        conn.row_factory = sqlite3.Row
-        row = conn.execute(
-            'SELECT api_key, model FROM ai_providers WHERE provider_name = ?',
-            (provider_name,)
-        ).fetchone()
-        conn.close()
-
-        if not row:
-            return jsonify({'success': False, 'error': 'Provider not found in database'})
-
-        result = test_provider_connection(provider_name, row['api_key'], row['model'])
+        result = test_provider_connection(provider_name, stored['api_key'], stored['model'])
         return jsonify(result)
     except Exception as e:
         logger.error(f"Error testing provider {provider_name}: {e}")
@@ -187,8 +224,8 @@ def test_ai_provider_endpoint():
         or 'error' message on failure.
     """
     data = request.json
-    if not data or 'provider' not in data or 'api_key' not in data:
-        return jsonify({'success': False, 'error': 'Missing required fields: provider, api_key'}), 400
+    if type(data) is not dict or _AI_PROVIDER_REQUIRED_FIELDS.difference(data):
+        return raw_json_response(_RESP_MISSING_PROVIDER_FIELDS, 400)
 
     result = test_provider_connection(
         data['provider'],
@@ -212,46 +249,7 @@ def get_data_providers():
         JSON array of data provider objects with id, name, type, status, and
         configuration details.
     """
-    # Stub: return built-in providers with default status
-    providers = [
-        {
-            'id': 'yahoo_finance',
-            'name': 'Yahoo Finance',
-            'type': 'market_data',
-            'status': 'active',
-            'is_default': True,
-            'requires_api_key': False,
-            'config': {}
-        },
-        {
-            'id': 'alpha_vantage',
-            'name': 'Alpha Vantage',
-            'type': 'market_data',
-            'status': 'unconfigured',
-            'is_default': False,
-            'requires_api_key': True,
-            'config': {}
-        },
-        {
-            'id': 'finnhub',
-            'name': 'Finnhub',
-            'type': 'market_data',
-            'status': 'unconfigured',
-            'is_default': False,
-            'requires_api_key': True,
-            'config': {}
-        },
-        {
-            'id': 'newsapi',
-            'name': 'NewsAPI',
-            'type': 'news',
-            'status': 'unconfigured',
-            'is_default': False,
-            'requires_api_key': True,
-            'config': {}
-        },
-    ]
-    return jsonify(providers)
+    return jsonify(_STUB_DATA_PROVIDERS)
 
 
 @settings_bp.route('/settings/data-provider', methods=['POST'])
@@ -267,8 +265,8 @@ def add_data_provider():
         JSON object with 'success' boolean.
     """
     data = request.json
-    if not data or 'provider_id' not in data:
-        return jsonify({'success': False, 'error': 'Missing required field: provider_id'}), 400
+    if type(data) is not dict or 'provider_id' not in data:
+        return raw_json_response(_RESP_MISSING_PROVIDER_ID, 400)
 
     # Stub implementation
     logger.info(f"Data provider configuration received for: {data.get('provider_id')}")
@@ -290,8 +288,8 @@ def test_data_provider():
         JSON object with 'success' boolean and optional 'error' message.
     """
     data = request.json
-    if not data or 'provider_id' not in data:
-        return jsonify({'success': False, 'error': 'Missing required field: provider_id'}), 400
+    if type(data) is not dict or 'provider_id' not in data:
+        return raw_json_response(_RESP_MISSING_PROVIDER_ID, 400)
 
     provider_id = data['provider_id']
 
@@ -357,8 +355,8 @@ def set_agent_framework():
         JSON object with 'success' boolean and the activated framework name.
     """
     data = request.json
-    if not data or 'framework' not in data:
-        return jsonify({'success': False, 'error': 'Missing required field: framework'}), 400
+    if type(data) is not dict or 'framework' not in data:
+        return raw_json_response(_RESP_MISSING_FRAMEWORK, 400)
 
     framework = data['framework']
     valid_frameworks = ['crewai', 'openclaw']
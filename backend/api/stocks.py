@@ -6,12 +6,15 @@ Blueprint for stock management endpoints: list, add, remove, and search stocks.
 from flask import Blueprint, jsonify, request
 import logging
 
+from backend.api._helpers import prerender_json, raw_json_response
 from backend.core.stock_manager import get_all_stocks, add_stock, remove_stock, search_stock_ticker
 
 logger = logging.getLogger(__name__)
 
 stocks_bp = Blueprint('stocks', __name__, url_prefix='/api')
 
+_RESP_MISSING_TICKER = prerender_json({'success': False, 'error': 'Missing required field: ticker'})
+
 
 @stocks_bp.route('/stocks', methods=['GET'])
 def get_stocks():
@@ -24,11 +27,8 @@ def get_stocks():
         JSON array of stock objects with ticker, name, market, added_at, active fields.
     """
     market = request.args.get('market', None)
-    stocks = get_all_stocks()
-
-    # Filter by market if specified
-    if market and market != 'All':
-        stocks = [s for s in stocks if s.get('market') == market]
+    # Market filter is applied in SQL rather than over the full list
+    stocks = get_all_stocks(market if market and market != 'All' else None)
 
     return jsonify(stocks)
 
@@ -47,8 +47,8 @@ def add_stock_endpoint():
         Returns 404 if ticker is not found on any exchange.
     """
     data = request.json
-    if not data or 'ticker' not in data:
-        return jsonify({'success': False, 'error': 'Missing required field: ticker'}), 400
+    if type(data) is not dict or 'ticker' not in data:
+        return raw_json_response(_RESP_MISSING_TICKER, 400)
 
     ticker = data['ticker'].strip().upper()
     name = data.get('name')
@@ -4,7 +4,6 @@ Creates and configures the Flask app, registers blueprints, sets up SSE,
 initialises the database and scheduler.
 """
 
-import json
 import queue
 import logging
 import threading
@@ -12,13 +11,17 @@ from datetime import datetime
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
-from flask import Flask, Response, jsonify, send_from_directory
+from flask import Flask, Response, g, send_from_directory
 
+from backend.api._helpers import json_dumps, json_response, prerender_json, raw_json_response
 from backend.config import Config
-from backend.database import init_all_tables
+from backend.database import (
+    init_all_tables, is_db_available, start_db_monitor,
+)
 
 logger = logging.getLogger(__name__)
 
+_RESP_TOO_LARGE = prerender_json({'success': False, 'error': 'Request body too large'})
 
 # ---------------------------------------------------------------------------
 # SSE (Server-Sent Events) infrastructure -- simple queue-based, no Redis
@@ -28,18 +31,42 @@ sse_clients: list[queue.Queue] = []
 sse_lock = threading.Lock()
 
 
+_SSE_HEARTBEAT = "event: heartbeat\ndata: {}\n\n"
+
+
 def send_sse_event(event_type: str, data: dict) -> None:
-    """Push an event to every connected SSE client."""
+    """Push an event to every connected SSE client.
+
+    The wire frame is built once here and shared by every client queue,
+    rather than each client's stream re-serializing the same payload.
+    """
+    frame = f"event: {event_type}\ndata: {json_dumps(data)}\n\n"
+    # Snapshot under the lock, push outside it: queue puts take each
+    # queue's own lock, and connecting/disconnecting streams shouldn't
+    # wait behind a full fan-out.
     with sse_lock:
-        dead_clients: list[queue.Queue] = []
-        for client_queue in sse_clients:
-            try:
-                client_queue.put_nowait((event_type, data))
-            except queue.Full:
-                dead_clients.append(client_queue)
-        # Remove any clients whose queues overflowed
-        for dead in dead_clients:
-            sse_clients.remove(dead)
+        clients = list(sse_clients)
+    dead_clients: list[queue.Queue] = []
+    for client_queue in clients:
+        try:
+            client_queue.put_nowait(frame)
+        except queue.Full:
+            dead_clients.append(client_queue)
+    # Remove any clients whose queues overflowed
+    if dead_clients:
+        with sse_lock:
+            for dead in dead_clients:
+                if dead in sse_clients:
+                    sse_clients.remove(dead)
+
+
+# ---------------------------------------------------------------------------
+# Health check -- both endpoints report the flag kept current by the
+# background database monitor (database.start_db_monitor).
+# ---------------------------------------------------------------------------
+
+_RESP_READY = prerender_json({'status': 'ready'})
+_RESP_NOT_READY = prerender_json({'status': 'unavailable'})
 
 
 # ---------------------------------------------------------------------------
@@ -57,6 +84,11 @@ def create_app() -> Flask:
 
     # -- Core Flask config ---------------------------------------------------
     app.config['SECRET_KEY'] = Config.SECRET_KEY
+    app.config['MAX_CONTENT_LENGTH'] = Config.MAX_CONTENT_LENGTH
+
+    @app.errorhandler(413)
+    def _payload_too_large(_err):
+        return raw_json_response(_RESP_TOO_LARGE, 413)
 
     # -- Logging -------------------------------------------------------------
     _setup_logging(app)
@@ -75,6 +107,13 @@ def create_app() -> Flask:
     with app.app_context():
         init_all_tables()
         logger.info("Database tables initialised")
+    start_db_monitor()
+
+    # -- Request clock -------------------------------------------------------
+    @app.before_request
+    def _stamp_request_time():
+        """Read the clock once per request; handlers use ``g.now_utc``."""
+        g.now_utc = datetime.utcnow()
 
     # -- Register API blueprints ---------------------------------------------
     _register_blueprints(app)
@@ -84,22 +123,18 @@ def create_app() -> Flask:
     def stream():
         """Server-Sent Events stream for real-time UI updates."""
         def event_stream():
-            q: queue.Queue = queue.Queue(maxsize=256)
+            q: queue.Queue = queue.Queue(maxsize=256)  # pre-built frames
             with sse_lock:
                 sse_clients.append(q)
             try:
                 # Send immediate heartbeat so the browser knows we're connected
-                yield "event: heartbeat\ndata: {}\n\n"
+                yield _SSE_HEARTBEAT
                 while True:
                     try:
-                        event_type, data = q.get(timeout=15)
-                        yield (
-                            f"event: {event_type}\n"
-                            f"data: {json.dumps(data)}\n\n"
-                        )
+                        yield q.get(timeout=15)
                     except queue.Empty:
                         # Send a heartbeat so proxies / browsers don't drop
-                        yield "event: heartbeat\ndata: {}\n\n"
+                        yield _SSE_HEARTBEAT
             except GeneratorExit:
                 pass
             finally:
@@ -121,23 +156,25 @@ def create_app() -> Flask:
     @app.route('/api/health')
     def health():
         """Simple health-check endpoint for load balancers / monitoring."""
-        import sqlite3
-        db_status = 'error'
-        try:
-            conn = sqlite3.connect(Config.DB_PATH)
-            conn.execute('SELECT 1')
-            conn.close()
-            db_status = 'ok'
-        except Exception:
-            pass
-
-        return jsonify({
+        return json_response({
             'status': 'ok',
             'version': '3.0.0',
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
-            'database': db_status,
+            'timestamp': g.now_utc.isoformat() + 'Z',
+            'database': 'ok' if is_db_available() else 'error',
         })
 
+    @app.route('/api/health/ready')
+    def health_ready():
+        """Readiness probe for orchestrators polling every few seconds.
+
+        Reads the flag kept by the background database monitor -- no
+        connection, query or lock per call.  503 while the monitor reports
+        the database unreachable.
+        """
+        if is_db_available():
+            return raw_json_response(_RESP_READY, 200)
+        return raw_json_response(_RESP_NOT_READY, 503)
+
     # -- Legacy dashboard fallback -------------------------------------------
     @app.route('/legacy')
     def legacy_dashboard():
@@ -20,6 +20,8 @@ class Config:
     else:
         BASE_DIR = Path(__file__).parent.parent  # tickerpulse-ai/
     DB_PATH = os.getenv('DB_PATH', str(BASE_DIR / 'stock_news.db'))
+    # Seconds between background availability probes (see database.start_db_monitor)
+    DB_HEALTH_CHECK_INTERVAL = int(os.getenv('DB_HEALTH_CHECK_INTERVAL', 10))
 
     # -------------------------------------------------------------------------
     # Flask
@@ -27,6 +29,9 @@ class Config:
     SECRET_KEY = os.getenv('SECRET_KEY', 'tickerpulse-dev-key-change-in-prod')
     FLASK_PORT = int(os.getenv('FLASK_PORT', 5000))
     FLASK_DEBUG = os.getenv('FLASK_DEBUG', 'false').lower() == 'true'
+    # Largest accepted request body; bigger uploads get 413 before being read.
+    # API bodies are small JSON objects (settings, chat messages, tickers).
+    MAX_CONTENT_LENGTH = int(os.getenv('MAX_CONTENT_LENGTH', 256 * 1024))
 
     # -------------------------------------------------------------------------
     # CORS
@@ -55,6 +60,11 @@ class Config:
     # -------------------------------------------------------------------------
     CHECK_INTERVAL = int(os.getenv('CHECK_INTERVAL', 300))  # seconds (5 min)
 
+    # Manual "Run now" triggers are dispatched to a small bounded pool; once
+    # MANUAL_JOB_QUEUE_LIMIT runs are pending, further triggers get a 503.
+    MANUAL_JOB_WORKERS = int(os.getenv('MANUAL_JOB_WORKERS', 2))
+    MANUAL_JOB_QUEUE_LIMIT = int(os.getenv('MANUAL_JOB_QUEUE_LIMIT', 8))
+
     SCHEDULER_API_ENABLED = False  # Disabled -- we use our own scheduler_routes blueprint
     SCHEDULER_API_PREFIX = '/api/scheduler'
 
@@ -74,6 +84,14 @@ class Config:
         'xai': 'grok-3',
     }
 
+    # HTTP timeouts (seconds) for AI provider calls: a short connect timeout
+    # so an unreachable endpoint fails fast, and a read timeout bounding how
+    # long one slow completion can hold a request thread.
+    AI_CONNECT_TIMEOUT = float(os.getenv('AI_CONNECT_TIMEOUT', 5))
+    AI_READ_TIMEOUT = float(os.getenv('AI_READ_TIMEOUT', 30))
+    # Keep-alive connections kept per provider host by the shared HTTP session
+    AI_HTTP_POOL_SIZE = int(os.getenv('AI_HTTP_POOL_SIZE', 32))
+
     # -------------------------------------------------------------------------
     # OpenClaw agent gateway
     # -------------------------------------------------------------------------
@@ -15,6 +15,20 @@ from backend.config import Config
 
 logger = logging.getLogger(__name__)
 
+_UPSERT_RATING_SQL = """
+    INSERT INTO ai_ratings
+        (ticker, rating, score, confidence, current_price, price_change, price_change_pct,
+         rsi, sentiment_score, sentiment_label, technical_score, summary, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(ticker) DO UPDATE SET
+        rating=excluded.rating, score=excluded.score, confidence=excluded.confidence,
+        current_price=excluded.current_price, price_change=excluded.price_change,
+        price_change_pct=excluded.price_change_pct, rsi=excluded.rsi,
+        sentiment_score=excluded.sentiment_score, sentiment_label=excluded.sentiment_label,
+        technical_score=excluded.technical_score, summary=excluded.summary,
+        updated_at=CURRENT_TIMESTAMP
+"""
+
 
 class StockAnalytics:
     def __init__(self, db_path=None):
@@ -423,38 +437,29 @@ class StockAnalytics:
 
     def _save_rating_to_db(self, rating_data: Dict) -> None:
         """Cache computed rating to ai_ratings table for fast subsequent reads."""
+        params = (
+            rating_data['ticker'],
+            rating_data['rating'],
+            rating_data['score'],
+            rating_data['confidence'],
+            rating_data.get('current_price'),
+            rating_data.get('price_change'),
+            rating_data.get('price_change_pct'),
+            rating_data.get('rsi'),
+            rating_data.get('sentiment_score'),
+            rating_data.get('sentiment_label', 'neutral'),
+            rating_data.get('technical_score'),
+            rating_data.get('analysis_summary'),
+        )
         try:
             conn = sqlite3.connect(self.db_path)
-            conn.execute("""
-                INSERT INTO ai_ratings
-                    (ticker, rating, score, confidence, current_price, price_change, price_change_pct,
-                     rsi, sentiment_score, sentiment_label, technical_score, summary, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                ON CONFLICT(ticker) DO UPDATE SET
-                    rating=excluded.rating, score=excluded.score, confidence=excluded.confidence,
-                    current_price=excluded.current_price, price_change=excluded.price_change,
-                    price_change_pct=excluded.price_change_pct, rsi=excluded.rsi,
-                    sentiment_score=excluded.sentiment_score, sentiment_label=excluded.sentiment_label,
-                    technical_score=excluded.technical_score, summary=excluded.summary,
-                    updated_at=CURRENT_TIMESTAMP
-            """, (
-                rating_data['ticker'],
-                rating_data['rating'],
-                rating_data['score'],
-                rating_data['confidence'],
-                rating_data.get('current_price'),
-                rating_data.get('price_change'),
-                rating_data.get('price_change_pct'),
-                rating_data.get('rsi'),
-                rating_data.get('sentiment_score'),
-                rating_data.get('sentiment_label', 'neutral'),
-                rating_data.get('technical_score'),
-                rating_data.get('analysis_summary'),
-            ))
-            conn.commit()
-            conn.close()
+            try:
+                conn.execute(_UPSERT_RATING_SQL, params)
+                conn.commit()
+            finally:
+                conn.close()
         except Exception as e:
-            logger.debug(f"Could not cache rating for {rating_data['ticker']}: {e}")
+            logger.warning(f"Could not cache rating for {rating_data['ticker']}: {e}")
 
     def _generate_summary(self, rating: str, score: float, technical_signals: List[str],
                          sentiment_signals: List[str]) -> tuple:
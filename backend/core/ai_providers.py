@@ -5,19 +5,40 @@ Supports multiple AI providers: OpenAI (ChatGPT), Anthropic (Claude), Google (Ge
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import logging
+import threading
 from typing import Dict, Optional, List
 from abc import ABC, abstractmethod
 
+from backend.config import Config
+
 logger = logging.getLogger(__name__)
 
 
+def _build_session() -> requests.Session:
+    """Shared HTTP session so provider calls reuse keep-alive TLS connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,  # distinct provider hosts
+        pool_maxsize=Config.AI_HTTP_POOL_SIZE,
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+_http = _build_session()
+
+
 class AIProvider(ABC):
     """Base class for AI providers"""
 
     def __init__(self, api_key: str):
         self.api_key = api_key
+        # (connect, read) timeouts for requests -- see Config.AI_*_TIMEOUT
+        self.timeout = (Config.AI_CONNECT_TIMEOUT, Config.AI_READ_TIMEOUT)
 
     @abstractmethod
     def generate_analysis(self, prompt: str, max_tokens: int = 500) -> str:
@@ -55,7 +76,7 @@ class OpenAIProvider(AIProvider):
                 "temperature": 0.7
             }
 
-            response = requests.post(self.base_url, headers=headers, json=data, timeout=30)
+            response = _http.post(self.base_url, headers=headers, json=data, timeout=self.timeout)
             response.raise_for_status()
 
             result = response.json()
@@ -94,7 +115,7 @@ class AnthropicProvider(AIProvider):
                 "system": "You are a financial analyst expert providing stock market analysis."
             }
 
-            response = requests.post(self.base_url, headers=headers, json=data, timeout=30)
+            response = _http.post(self.base_url, headers=headers, json=data, timeout=self.timeout)
             response.raise_for_status()
 
             result = response.json()
@@ -134,11 +155,11 @@ class GoogleProvider(AIProvider):
                 }
             }
 
-            response = requests.post(
+            response = _http.post(
                 f"{self.base_url}?key={self.api_key}",
                 headers=headers,
                 json=data,
-                timeout=30
+                timeout=self.timeout
             )
 
             # Log error details if request fails
@@ -185,11 +206,15 @@ class GrokProvider(AIProvider):
                 "temperature": 0.7
             }
 
-            # Log debug info (API key first 10 chars only for security)
-            api_key_preview = self.api_key[:10] + "..." if len(self.api_key) > 10 else "***"
-            logger.debug(f"Grok API request - Model: {self.model}, API Key: {api_key_preview}, URL: {self.base_url}")
+            # Log debug info (API key first 10 chars only for security).
+            # Guarded so the preview and message aren't built on every call
+            # when DEBUG is off.
+            if logger.isEnabledFor(logging.DEBUG):
+                api_key_preview = self.api_key[:10] + "..." if len(self.api_key) > 10 else "***"
+                logger.debug("Grok API request - Model: %s, API Key: %s, URL: %s",
+                             self.model, api_key_preview, self.base_url)
 
-            response = requests.post(self.base_url, headers=headers, json=data, timeout=30)
+            response = _http.post(self.base_url, headers=headers, json=data, timeout=self.timeout)
 
             # Log error details if request fails
             if response.status_code != 200:
@@ -228,10 +253,22 @@ class AIProviderFactory:
         'grok': GrokProvider
     }
 
+    # Providers hold no per-call state, so instances are shared per
+    # (provider, api_key, model) instead of being rebuilt on every request.
+    _instances: Dict[tuple, AIProvider] = {}
+    _instances_lock = threading.Lock()
+    _MAX_INSTANCES = 256
+
     @classmethod
     def create_provider(cls, provider_name: str, api_key: str, model: Optional[str] = None) -> Optional[AIProvider]:
-        """Create an AI provider instance"""
-        provider_class = cls.PROVIDERS.get(provider_name.lower())
+        """Create (or reuse) an AI provider instance"""
+        name = provider_name.lower()
+        key = (name, api_key, model)
+        provider = cls._instances.get(key)
+        if provider is not None:
+            return provider
+
+        provider_class = cls.PROVIDERS.get(name)
 
         if not provider_class:
             logger.error(f"Unknown provider: {provider_name}")
@@ -239,13 +276,18 @@ class AIProviderFactory:
 
         try:
             if model:
-                return provider_class(api_key, model)
+                provider = provider_class(api_key, model)
             else:
-                return provider_class(api_key)
+                provider = provider_class(api_key)
         except Exception as e:
             logger.error(f"Error creating provider {provider_name}: {e}")
             return None
 
+        with cls._instances_lock:
+            if len(cls._instances) >= cls._MAX_INSTANCES:
+                cls._instances.clear()
+            return cls._instances.setdefault(key, provider)
+
     @classmethod
     def get_available_providers(cls) -> List[Dict[str, str]]:
         """Get list of available providers"""
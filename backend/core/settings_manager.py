@@ -6,12 +6,27 @@ Handles application settings including AI provider API keys
 
 import sqlite3
 import logging
+import threading
+import time
 from typing import Dict, Optional
 
 from backend.config import Config
 
 logger = logging.getLogger(__name__)
 
+# The active provider is read on every chat message and AI rating but only
+# changes from the settings page, so it is cached briefly and the writers
+# below invalidate it.
+_ACTIVE_PROVIDER_TTL_SECONDS = 30
+_active_provider_cache = {'expires': 0.0, 'value': None}
+_active_provider_lock = threading.Lock()
+_LOAD_FAILED = object()
+
+
+def invalidate_active_provider_cache():
+    """Force the next get_active_ai_provider() call to re-read the database."""
+    _active_provider_cache['expires'] = 0.0
+
 
 def init_settings_table():
     """Initialize settings table in database"""
@@ -81,7 +96,23 @@ def set_setting(key: str, value: str):
 
 
 def get_active_ai_provider() -> Optional[Dict]:
-    """Get the currently active AI provider"""
+    """Get the currently active AI provider (cached, see _ACTIVE_PROVIDER_TTL_SECONDS)"""
+    with _active_provider_lock:
+        if _active_provider_cache['expires'] > time.monotonic():
+            value = _active_provider_cache['value']
+            return dict(value) if value else None
+
+    provider = _load_active_ai_provider()
+    if provider is not _LOAD_FAILED:
+        with _active_provider_lock:
+            _active_provider_cache['value'] = provider
+            _active_provider_cache['expires'] = time.monotonic() + _ACTIVE_PROVIDER_TTL_SECONDS
+        return dict(provider) if provider else None
+    return None
+
+
+def _load_active_ai_provider():
+    """Read the active provider row; ``_LOAD_FAILED`` on error (not cached)."""
     try:
         conn = sqlite3.connect(Config.DB_PATH)
         conn.row_factory = sqlite3.Row
@@ -107,6 +138,35 @@ def get_active_ai_provider() -> Optional[Dict]:
         return None
     except Exception as e:
         logger.error(f"Error getting active AI provider: {e}")
+        return _LOAD_FAILED
+
+
+def get_ai_provider(provider_name: str) -> Optional[Dict]:
+    """Get a single configured AI provider (with API key) by name"""
+    try:
+        conn = sqlite3.connect(Config.DB_PATH)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            SELECT id, provider_name, api_key, model FROM ai_providers
+            WHERE provider_name = ? AND api_key IS NOT NULL AND api_key != ''
+            LIMIT 1
+        ''', (provider_name,))
+
+        result = cursor.fetchone()
+        conn.close()
+
+        if result:
+            return {
+                'id': result['id'],
+                'provider_name': result['provider_name'],
+                'api_key': result['api_key'],
+                'model': result['model']
+            }
+        return None
+    except Exception as e:
+        logger.error(f"Error getting AI provider {provider_name}: {e}")
         return None
 
 
@@ -149,22 +209,15 @@ def add_ai_provider(provider_name: str, api_key: str, model: Optional[str] = Non
         if set_active:
             cursor.execute('UPDATE ai_providers SET is_active = 0')
 
-        # Check if provider already exists
+        # Update in place; the row count tells us whether it existed, so the
+        # common re-save path needs no separate existence probe.
         cursor.execute('''
-            SELECT id FROM ai_providers
+            UPDATE ai_providers
+            SET api_key = ?, model = ?, is_active = ?, updated_at = datetime('now')
             WHERE provider_name = ?
-        ''', (provider_name,))
-
-        existing = cursor.fetchone()
+        ''', (api_key, model, 1 if set_active else 0, provider_name))
 
-        if existing:
-            # Update existing
-            cursor.execute('''
-                UPDATE ai_providers
-                SET api_key = ?, model = ?, is_active = ?, updated_at = datetime('now')
-                WHERE provider_name = ?
-            ''', (api_key, model, 1 if set_active else 0, provider_name))
-        else:
+        if cursor.rowcount == 0:
             # Insert new
             cursor.execute('''
                 INSERT INTO ai_providers (provider_name, api_key, model, is_active)
@@ -173,6 +226,7 @@ def add_ai_provider(provider_name: str, api_key: str, model: Optional[str] = Non
 
         conn.commit()
         conn.close()
+        invalidate_active_provider_cache()
         logger.info(f"AI provider {provider_name} added/updated")
         return True
     except Exception as e:
@@ -198,6 +252,7 @@ def set_active_provider(provider_id: int) -> bool:
 
         conn.commit()
         conn.close()
+        invalidate_active_provider_cache()
         logger.info(f"Provider {provider_id} set as active")
         return True
     except Exception as e:
@@ -215,6 +270,7 @@ def delete_ai_provider(provider_id: int) -> bool:
 
         conn.commit()
         conn.close()
+        invalidate_active_provider_cache()
         logger.info(f"Provider {provider_id} deleted")
         return True
     except Exception as e:
@@ -36,9 +36,9 @@ def init_stocks_table():
         # Column already exists
         pass
 
-    # Add default stocks if table is empty
-    cursor.execute('SELECT COUNT(*) FROM stocks')
-    if cursor.fetchone()[0] == 0:
+    # Add default stocks if table is empty (existence check, not a full count)
+    cursor.execute('SELECT 1 FROM stocks LIMIT 1')
+    if cursor.fetchone() is None:
         default_stocks = [
             # US Stocks
             ('TSLA', 'Tesla Inc', 'US'),
@@ -88,14 +88,17 @@ def get_active_stocks() -> List[str]:
     return stocks
 
 
-def get_all_stocks() -> List[Dict]:
-    """Get all stocks with details"""
+def get_all_stocks(market: Optional[str] = None) -> List[Dict]:
+    """Get all stocks with details, optionally restricted to one market"""
     conn = sqlite3.connect(Config.DB_PATH)
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
-    cursor.execute('SELECT * FROM stocks ORDER BY ticker')
-    stocks = [dict(row) for row in cursor.fetchall()]
+    if market:
+        cursor.execute('SELECT * FROM stocks WHERE market = ? ORDER BY ticker', (market,))
+    else:
+        cursor.execute('SELECT * FROM stocks ORDER BY ticker')
+    stocks = [dict(row) for row in cursor]
 
     conn.close()
     return stocks
@@ -567,7 +567,10 @@ class EnhancedStockNewsMonitor:
 
 
     def save_news(self, article: Dict) -> int:
-        """Save news article to database and return news_id"""
+        """Save news article to database and return news_id
+
+        Bulk ingestion goes through save_news_batch instead.
+        """
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
@@ -604,24 +607,94 @@ class EnhancedStockNewsMonitor:
                                 f"Positive news detected for {article['ticker']}: {article['title'][:100]}")
                 conn.commit()
 
-            conn.close()
             return news_id
 
         except sqlite3.IntegrityError:
             # Article already exists
-            conn.close()
+            conn.rollback()
             return -1
         except Exception as e:
             logger.error(f"Error saving news: {e}")
-            conn.close()
+            conn.rollback()
             return -1
+        finally:
+            conn.close()
 
-    def create_alert(self, cursor, ticker: str, news_id: int, alert_type: str, message: str):
-        """Create an alert"""
+    def save_news_batch(self, articles: List[Dict], conn: sqlite3.Connection) -> int:
+        """Save a fetcher's articles in one transaction; return how many were new
+
+        Most fetched articles are already stored, so rows go in with
+        INSERT OR IGNORE and the whole batch (plus any alerts) is committed
+        once instead of paying a commit -- or a rollback -- per article.
+        Each article runs under its own SAVEPOINT, so a malformed one is
+        skipped without losing the rest of the batch.
+        """
+        cursor = conn.cursor()
+        new_count = 0
+        alerts = []  # logged only once the batch is committed
+        try:
+            for article in articles:
+                cursor.execute('SAVEPOINT save_article')
+                try:
+                    full_text = f"{article['title']} {article.get('description', '')}"
+                    sentiment_score, sentiment_label = self.calculate_sentiment(
+                        full_text,
+                        article.get('engagement_score', 0)
+                    )
+                    cursor.execute('''
+                        INSERT OR IGNORE INTO news (ticker, title, description, url, source, published_date,
+                                                   sentiment_score, sentiment_label, engagement_score)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', (
+                        article['ticker'],
+                        article['title'],
+                        article.get('description', ''),
+                        article['url'],
+                        article['source'],
+                        article['published_date'],
+                        sentiment_score,
+                        sentiment_label,
+                        article.get('engagement_score', 0)
+                    ))
+                    is_new = cursor.rowcount == 1  # 0: article already exists
+
+                    # Create alert if sentiment is positive
+                    message = None
+                    if is_new and sentiment_label == 'positive' and sentiment_score > 0.3:
+                        message = f"Positive news detected for {article['ticker']}: {article['title'][:100]}"
+                        self.insert_alert(cursor, article['ticker'], cursor.lastrowid,
+                                          'POSITIVE_NEWS', message)
+                    cursor.execute('RELEASE SAVEPOINT save_article')
+                except Exception as e:
+                    logger.error(f"Error saving news: {e}")
+                    cursor.execute('ROLLBACK TO SAVEPOINT save_article')
+                    cursor.execute('RELEASE SAVEPOINT save_article')
+                    continue
+
+                if is_new:
+                    new_count += 1
+                if message:
+                    alerts.append(message)
+            conn.commit()
+        except Exception as e:
+            logger.error(f"Error saving news batch: {e}")
+            conn.rollback()
+            return 0
+
+        for message in alerts:
+            logger.info(f"🔔 ALERT: {message}")
+        return new_count
+
+    def insert_alert(self, cursor, ticker: str, news_id: int, alert_type: str, message: str):
+        """Insert an alert row without logging it (the caller logs after commit)"""
         cursor.execute('''
             INSERT INTO alerts (ticker, news_id, alert_type, message)
             VALUES (?, ?, ?, ?)
         ''', (ticker, news_id, alert_type, message))
+
+    def create_alert(self, cursor, ticker: str, news_id: int, alert_type: str, message: str):
+        """Create an alert"""
+        self.insert_alert(cursor, ticker, news_id, alert_type, message)
         logger.info(f"🔔 ALERT: {message}")
 
     def update_monitor_status(self, status: str, message: str):
@@ -651,65 +724,66 @@ class EnhancedStockNewsMonitor:
         total_new_articles = 0
         source_stats = {}
 
-        for ticker in STOCKS:
-            logger.info(f"\n{'='*60}")
-            logger.info(f"Fetching news for {ticker}...")
-            logger.info(f"{'='*60}")
-
-            # Fetch from ALL sources (global sources for all stocks)
-            all_fetchers = [
-                ('Google News', self.fetch_google_news),
-                ('Yahoo Finance', self.fetch_yahoo_finance_rss),
-                ('Seeking Alpha', self.fetch_seeking_alpha),
-                ('MarketWatch', self.fetch_marketwatch),
-                ('Benzinga', self.fetch_benzinga),
-                ('Finviz', self.fetch_finviz_news),
-                ('Reddit', self.fetch_reddit),
-                ('StockTwits', self.fetch_stocktwits),
-                ('Twitter/X', self.fetch_twitter_via_nitter),
-            ]
-
-            # Add India-specific sources for Indian stocks (.NS and .BO)
-            is_indian_stock = '.NS' in ticker.upper() or '.BO' in ticker.upper()
-            if is_indian_stock:
-                india_fetchers = [
-                    ('Economic Times', self.fetch_economic_times),
-                    ('Moneycontrol', self.fetch_moneycontrol),
-                    ('Mint', self.fetch_mint),
+        # One connection for the whole pass instead of one per article
+        conn = sqlite3.connect(self.db_path)
+        try:
+            for ticker in STOCKS:
+                logger.info(f"\n{'='*60}")
+                logger.info(f"Fetching news for {ticker}...")
+                logger.info(f"{'='*60}")
+
+                # Fetch from ALL sources (global sources for all stocks)
+                all_fetchers = [
+                    ('Google News', self.fetch_google_news),
+                    ('Yahoo Finance', self.fetch_yahoo_finance_rss),
+                    ('Seeking Alpha', self.fetch_seeking_alpha),
+                    ('MarketWatch', self.fetch_marketwatch),
+                    ('Benzinga', self.fetch_benzinga),
+                    ('Finviz', self.fetch_finviz_news),
+                    ('Reddit', self.fetch_reddit),
+                    ('StockTwits', self.fetch_stocktwits),
+                    ('Twitter/X', self.fetch_twitter_via_nitter),
                 ]
-                all_fetchers.extend(india_fetchers)
-                logger.info(f"  📍 Indian stock detected - including India-specific sources")
 
-            ticker_new_count = 0
+                # Add India-specific sources for Indian stocks (.NS and .BO)
+                is_indian_stock = '.NS' in ticker.upper() or '.BO' in ticker.upper()
+                if is_indian_stock:
+                    india_fetchers = [
+                        ('Economic Times', self.fetch_economic_times),
+                        ('Moneycontrol', self.fetch_moneycontrol),
+                        ('Mint', self.fetch_mint),
+                    ]
+                    all_fetchers.extend(india_fetchers)
+                    logger.info(f"  📍 Indian stock detected - including India-specific sources")
 
-            for source_name, fetcher in all_fetchers:
-                try:
-                    logger.info(f"  Fetching from {source_name}...")
-                    articles = fetcher(ticker)
+                ticker_new_count = 0
 
-                    source_count = 0
-                    for article in articles:
-                        news_id = self.save_news(article)
-                        if news_id > 0:
-                            source_count += 1
-                            ticker_new_count += 1
+                for source_name, fetcher in all_fetchers:
+                    try:
+                        logger.info(f"  Fetching from {source_name}...")
+                        articles = fetcher(ticker)
 
-                    if source_count > 0:
-                        logger.info(f"    ✓ Found {source_count} new articles from {source_name}")
-                        source_stats[source_name] = source_stats.get(source_name, 0) + source_count
+                        source_count = self.save_news_batch(articles, conn)
+                        ticker_new_count += source_count
 
-                    # Small delay between sources
-                    time.sleep(0.5)
+                        if source_count > 0:
+                            logger.info(f"    ✓ Found {source_count} new articles from {source_name}")
+                            source_stats[source_name] = source_stats.get(source_name, 0) + source_count
 
-                except Exception as e:
-                    logger.error(f"    ✗ Error with {source_name}: {e}")
+                        # Small delay between sources
+                        time.sleep(0.5)
+
+                    except Exception as e:
+                        logger.error(f"    ✗ Error with {source_name}: {e}")
 
-            if ticker_new_count > 0:
-                logger.info(f"  Total: {ticker_new_count} new articles for {ticker}")
-                total_new_articles += ticker_new_count
+                if ticker_new_count > 0:
+                    logger.info(f"  Total: {ticker_new_count} new articles for {ticker}")
+                    total_new_articles += ticker_new_count
 
-            # Delay between tickers
-            time.sleep(2)
+                # Delay between tickers
+                time.sleep(2)
+        finally:
+            conn.close()
 
         # Log summary
         logger.info(f"\n{'='*60}")
@@ -201,13 +201,9 @@ class AlphaVantageProvider(DataProvider):
         bars = []
         for date_str, values in sorted(series.items()):
             try:
-                if 'T' in date_str or ':' in date_str:
-                    # Intraday format: "2024-01-15 09:35:00"
-                    ts_dt = datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-                else:
-                    ts_dt = datetime.strptime(date_str, '%Y-%m-%d')
-
-                ts_unix = int(ts_dt.timestamp())
+                # Daily "2024-01-15" or intraday "2024-01-15 09:35:00" -- both
+                # ISO forms, so the C fromisoformat parser replaces strptime.
+                ts_unix = int(datetime.fromisoformat(date_str).timestamp())
                 if ts_unix < cutoff:
                     continue
 
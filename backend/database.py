@@ -5,7 +5,10 @@ Thread-safe SQLite helper with context-manager support and table initialisation.
 
 import sqlite3
 import logging
+import threading
+import time
 from contextlib import contextmanager
+from pathlib import Path
 
 from backend.config import Config
 
@@ -16,6 +19,13 @@ logger = logging.getLogger(__name__)
 # Connection helpers
 # ---------------------------------------------------------------------------
 
+_MMAP_SIZE = 256 * 1024 * 1024  # memory-map up to 256 MB of the database file
+
+# WAL is persistent in the database file, so ``journal_mode=WAL`` (which
+# needs a lock round-trip) only has to be issued once per path per process.
+_wal_paths: set[str] = set()
+
+
 def get_db_connection(db_path: str | None = None) -> sqlite3.Connection:
     """Return a new SQLite connection with Row factory enabled.
 
@@ -33,11 +43,35 @@ def get_db_connection(db_path: str | None = None) -> sqlite3.Connection:
     path = db_path or Config.DB_PATH
     conn = sqlite3.connect(path, check_same_thread=False)
     conn.row_factory = sqlite3.Row
-    conn.execute('PRAGMA journal_mode=WAL')  # better concurrent-read perf
+    if path not in _wal_paths:
+        # better concurrent-read perf
+        if conn.execute('PRAGMA journal_mode=WAL').fetchone()[0].lower() == 'wal':
+            _wal_paths.add(path)
+    # In WAL mode NORMAL only syncs at checkpoints -- still crash-safe, but
+    # commits no longer pay an fsync each.
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA wal_autocheckpoint=1000')  # pages
+    conn.execute(f'PRAGMA mmap_size={_MMAP_SIZE}')
+    conn.execute('PRAGMA temp_store=MEMORY')  # sorts / GROUP BY temp b-trees
     conn.execute('PRAGMA foreign_keys=ON')
     return conn
 
 
+def get_readonly_connection(db_path: str | None = None) -> sqlite3.Connection:
+    """Return a read-only SQLite connection (``mode=ro`` URI) for GET handlers.
+
+    Readers never take write locks, and with WAL they are not blocked by a
+    concurrent writer.  Any attempt to write raises
+    ``sqlite3.OperationalError``.
+    """
+    path = Path(db_path or Config.DB_PATH).resolve()
+    conn = sqlite3.connect(f'{path.as_uri()}?mode=ro', uri=True, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute(f'PRAGMA mmap_size={_MMAP_SIZE}')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    return conn
+
+
 @contextmanager
 def db_session(db_path: str | None = None):
     """Context manager that yields a connection and auto-closes it.
@@ -48,8 +82,14 @@ def db_session(db_path: str | None = None):
             cursor = conn.cursor()
             cursor.execute('SELECT ...')
             conn.commit()
+
+    The implicit transaction opens as ``BEGIN IMMEDIATE``: the write lock
+    is taken up front (waiting out the busy timeout if needed) instead of
+    upgrading a read lock mid-transaction, which can fail with
+    SQLITE_BUSY when another writer got there first.
     """
     conn = get_db_connection(db_path)
+    conn.isolation_level = 'IMMEDIATE'
     try:
         yield conn
         conn.commit()
@@ -276,9 +316,81 @@ _INDEXES_SQL = [
     "CREATE INDEX IF NOT EXISTS idx_download_stats_repo    ON download_stats (repo_owner, repo_name)",
     "CREATE INDEX IF NOT EXISTS idx_download_stats_date    ON download_stats (recorded_at)",
     "CREATE INDEX IF NOT EXISTS idx_download_daily_date    ON download_daily (date)",
+    # Compound indices matching the "filter by key, newest first" read paths
+    # (download_daily needs none: its primary key already covers it)
+    "CREATE INDEX IF NOT EXISTS idx_agent_runs_agent_started ON agent_runs (agent_name, started_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_agent_runs_status_started ON agent_runs (status, started_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_download_stats_repo_recorded ON download_stats (repo_owner, repo_name, recorded_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_research_briefs_ticker_created ON research_briefs (ticker, created_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_research_briefs_created ON research_briefs (created_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_news_ticker_created    ON news (ticker, created_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_job_history_job_executed ON job_history (job_id, executed_at DESC)",
+    # Covering index for the windowed cost summary (AgentRegistry.get_cost_summary)
+    "CREATE INDEX IF NOT EXISTS idx_agent_runs_created_cost ON agent_runs (created_at, agent_name, estimated_cost, tokens_input, tokens_output)",
 ]
 
 
+# ---------------------------------------------------------------------------
+# Availability monitor
+# ---------------------------------------------------------------------------
+
+_db_available = True
+_monitor_thread: threading.Thread | None = None
+_monitor_lock = threading.Lock()
+
+
+def is_db_available() -> bool:
+    """Result of the most recent background probe (True until proven otherwise)."""
+    return _db_available
+
+
+def _probe_db(db_path: str) -> bool:
+    try:
+        # mode=rw never creates a missing file, and reading sqlite_master
+        # actually touches the database (a bare SELECT 1 cannot fail).
+        uri = f'{Path(db_path).resolve().as_uri()}?mode=rw'
+        conn = sqlite3.connect(uri, uri=True, timeout=2)
+        try:
+            conn.execute('SELECT 1 FROM sqlite_master LIMIT 1').fetchone()
+        finally:
+            conn.close()
+        return True
+    except Exception:
+        return False
+
+
+def _monitor_loop(db_path: str, interval: float) -> None:
+    global _db_available
+    while True:
+        ok = _probe_db(db_path)
+        if ok != _db_available:
+            if ok:
+                logger.info("Database is reachable again")
+            else:
+                logger.error("Database probe failed -- marking database unavailable")
+        _db_available = ok
+        time.sleep(interval)
+
+
+def start_db_monitor(db_path: str | None = None, interval: float | None = None) -> None:
+    """Start the background probe that drives is_db_available().
+
+    One probe per interval per process, instead of every request paying a
+    connection timeout while the database is unreachable.  Idempotent.
+    """
+    global _monitor_thread
+    with _monitor_lock:
+        if _monitor_thread is not None and _monitor_thread.is_alive():
+            return
+        _monitor_thread = threading.Thread(
+            target=_monitor_loop,
+            args=(db_path or Config.DB_PATH, interval or Config.DB_HEALTH_CHECK_INTERVAL),
+            name='db-monitor',
+            daemon=True,
+        )
+        _monitor_thread.start()
+
+
 # ---------------------------------------------------------------------------
 # Public initialisation function
 # ---------------------------------------------------------------------------
@@ -345,6 +457,9 @@ def init_all_tables(db_path: str | None = None) -> None:
             cursor.execute(sql)
 
         conn.commit()
+        # Refresh planner statistics (cheap no-op when nothing changed) so
+        # the compound indexes are chosen over the single-column ones.
+        conn.execute('PRAGMA optimize')
         logger.info("All database tables and indexes initialised successfully")
     except Exception:
         conn.rollback()
@@ -25,11 +25,17 @@ def _get_agent_registry():
     return AgentRegistry(db_path=Config.DB_PATH)
 
 
+_send_sse_event = None
+
+
 def _send_sse(event_type: str, data: dict) -> None:
     """Send an SSE event, handling import errors gracefully."""
+    global _send_sse_event
     try:
-        from backend.app import send_sse_event
-        send_sse_event(event_type, data)
+        if _send_sse_event is None:
+            from backend.app import send_sse_event
+            _send_sse_event = send_sse_event
+        _send_sse_event(event_type, data)
     except Exception as exc:
         logger.debug("SSE send failed (may be normal during testing): %s", exc)
 
@@ -49,18 +55,31 @@ def _get_watchlist() -> list:
         return []
 
 
+_INSERT_JOB_HISTORY_SQL = (
+    "INSERT INTO job_history (job_id, job_name, status, result_summary, "
+    "agent_name, duration_ms, cost, executed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+# History reads, keyed by whether a job_id filter is present, so each
+# filter combination always maps to the same statement text.
+_JOB_HISTORY_COLUMNS = (
+    'id', 'job_id', 'job_name', 'status', 'result_summary', 'agent_name',
+    'duration_ms', 'cost', 'executed_at',
+)
+_JOB_HISTORY_SELECT = f"SELECT {', '.join(_JOB_HISTORY_COLUMNS)} FROM job_history"
+_SELECT_JOB_HISTORY_SQL = {
+    False: f"{_JOB_HISTORY_SELECT} ORDER BY executed_at DESC LIMIT ?",
+    True: f"{_JOB_HISTORY_SELECT} WHERE job_id = ? ORDER BY executed_at DESC LIMIT ?",
+}
+
+
 def save_job_history(job_id: str, job_name: str, status: str,
                      result_summary: str, agent_name: Optional[str],
                      duration_ms: int, cost: float = 0.0) -> None:
     """Persist a job execution record to the job_history table."""
     try:
         conn = sqlite3.connect(Config.DB_PATH)
-        conn.execute(
-            """INSERT INTO job_history
-               (job_id, job_name, status, result_summary, agent_name,
-                duration_ms, cost, executed_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
+        try:
+            conn.execute(_INSERT_JOB_HISTORY_SQL, (
                 job_id,
                 job_name,
                 status,
@@ -69,10 +88,10 @@ def save_job_history(job_id: str, job_name: str, status: str,
                 duration_ms,
                 cost,
                 datetime.utcnow().isoformat(),
-            ),
-        )
-        conn.commit()
-        conn.close()
+            ))
+            conn.commit()
+        finally:
+            conn.close()
     except Exception as exc:
         logger.error("Failed to save job_history for %s: %s", job_id, exc)
 
@@ -81,19 +100,15 @@ def get_job_history(job_id: Optional[str] = None, limit: int = 50) -> list:
     """Retrieve recent job execution history from the database."""
     try:
         conn = sqlite3.connect(Config.DB_PATH)
-        conn.row_factory = sqlite3.Row
-        if job_id:
-            rows = conn.execute(
-                "SELECT * FROM job_history WHERE job_id = ? ORDER BY executed_at DESC LIMIT ?",
-                (job_id, limit),
-            ).fetchall()
-        else:
-            rows = conn.execute(
-                "SELECT * FROM job_history ORDER BY executed_at DESC LIMIT ?",
-                (limit,),
-            ).fetchall()
+        params = (job_id, limit) if job_id else (limit,)
+        # Plain tuples zipped onto the fixed column list -- no sqlite3.Row
+        # name lookups per field.
+        history = [
+            dict(zip(_JOB_HISTORY_COLUMNS, row))
+            for row in conn.execute(_SELECT_JOB_HISTORY_SQL[bool(job_id)], params)
+        ]
         conn.close()
-        return [dict(r) for r in rows]
+        return history
     except Exception as exc:
         logger.error("Failed to get job_history: %s", exc)
         return []
@@ -131,14 +131,18 @@ def run_daily_summary():
 
 def _get_todays_job_stats() -> dict:
     """Query job_history for today's execution statistics."""
-    today = datetime.utcnow().strftime('%Y-%m-%d')
+    # Half-open [today, tomorrow) range instead of DATE(executed_at) = ? so
+    # the executed_at index can be used.
+    today = datetime.utcnow().date()
+    day_start = today.isoformat()
+    day_end = (today + timedelta(days=1)).isoformat()
     stats = {'total_runs': 0, 'success': 0, 'errors': 0, 'skipped': 0, 'total_cost': 0.0}
     try:
         conn = sqlite3.connect(Config.DB_PATH)
         conn.row_factory = sqlite3.Row
         rows = conn.execute(
-            "SELECT status, cost FROM job_history WHERE DATE(executed_at) = ?",
-            (today,),
+            "SELECT status, cost FROM job_history WHERE executed_at >= ? AND executed_at < ?",
+            (day_start, day_end),
         ).fetchall()
         conn.close()
 
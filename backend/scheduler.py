@@ -3,7 +3,10 @@ APScheduler configuration and management for TickerPulse AI.
 Sets up job store (SQLite), job defaults, and exposes helpers.
 """
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor as _DispatchExecutor
 from datetime import datetime
+from enum import Enum
 from typing import Dict, List, Optional, Any
 
 import pytz
@@ -36,6 +39,22 @@ def _tz(name: str):
 logger = logging.getLogger(__name__)
 
 
+class TriggerResult(Enum):
+    """Outcome of SchedulerManager.trigger_job (the only admission point).
+
+    Truthy only for ``TRIGGERED``, so ``if sm.trigger_job(job_id):`` keeps
+    the meaning it had when the method returned a bool.
+    """
+    TRIGGERED = 'triggered'
+    UNKNOWN_JOB = 'unknown_job'
+    ALREADY_RUNNING = 'already_running'
+    QUEUE_FULL = 'queue_full'
+    FAILED = 'failed'
+
+    def __bool__(self) -> bool:
+        return self is TriggerResult.TRIGGERED
+
+
 class SchedulerManager:
     """Manages all scheduled jobs for TickerPulse AI."""
 
@@ -43,6 +62,11 @@ class SchedulerManager:
         self.scheduler = None
         self.app = app
         self._job_registry: Dict[str, Dict[str, Any]] = {}  # name -> job metadata
+        # Bounded dispatcher for manual triggers (see trigger_job)
+        self._manual_executor: Optional[_DispatchExecutor] = None
+        self._manual_pending = 0
+        self._manual_active: set = set()  # job ids queued or running manually
+        self._manual_lock = threading.Lock()
 
     def init_app(self, app):
         """Initialize scheduler with Flask app."""
@@ -200,28 +224,65 @@ class SchedulerManager:
             logger.error("Failed to resume job %s: %s", job_id, exc)
             return False
 
-    def trigger_job(self, job_id: str) -> bool:
-        """Trigger immediate execution of a job."""
+    def manual_queue_depth(self) -> int:
+        """Number of manually triggered runs queued or still executing."""
+        return self._manual_pending
+
+    def _get_manual_executor(self) -> _DispatchExecutor:
+        if self._manual_executor is None:
+            self._manual_executor = _DispatchExecutor(
+                max_workers=Config.MANUAL_JOB_WORKERS,
+                thread_name_prefix='manual-job',
+            )
+        return self._manual_executor
+
+    def _run_manual(self, job_id: str, func) -> None:
+        try:
+            func()
+        except Exception as exc:
+            logger.error("Manual run of job %s failed: %s", job_id, exc)
+        finally:
+            with self._manual_lock:
+                self._manual_pending -= 1
+                self._manual_active.discard(job_id)
+
+    def trigger_job(self, job_id: str) -> TriggerResult:
+        """Trigger immediate execution of a job.
+
+        The run is submitted to a bounded dispatcher pool instead of adding a
+        one-shot job to APScheduler, so repeated "Run now" clicks queue up
+        behind ``MANUAL_JOB_WORKERS`` threads.  Admission is decided here,
+        under one lock: a job already queued or running manually is rejected
+        with ``ALREADY_RUNNING`` (so two workers never run it at once), and
+        nothing is queued once ``MANUAL_JOB_QUEUE_LIMIT`` runs are pending
+        (``QUEUE_FULL``).
+        """
         if job_id not in self._job_registry:
             logger.warning("Cannot trigger unknown job: %s", job_id)
-            return False
+            return TriggerResult.UNKNOWN_JOB
+        with self._manual_lock:
+            if job_id in self._manual_active:
+                logger.info("Job %s already queued or running -- not triggering again", job_id)
+                return TriggerResult.ALREADY_RUNNING
+            if self._manual_pending >= Config.MANUAL_JOB_QUEUE_LIMIT:
+                logger.warning("Manual job queue full (%d pending) -- rejecting %s",
+                               self._manual_pending, job_id)
+                return TriggerResult.QUEUE_FULL
+            self._manual_pending += 1
+            self._manual_active.add(job_id)
+            depth = self._manual_pending
         try:
             meta = self._job_registry[job_id]
-            # Add a one-shot job that runs immediately
-            if self.scheduler:
-                self.scheduler.add_job(
-                    meta['func'],
-                    'date',
-                    id=f'{job_id}_manual_{datetime.utcnow().strftime("%Y%m%d%H%M%S")}',
-                    name=f'{meta["name"]} (manual)',
-                    run_date=datetime.now(_tz(Config.MARKET_TIMEZONE)),
-                    replace_existing=False,
-                )
-            logger.info("Triggered immediate run of job: %s", job_id)
-            return True
+            self._get_manual_executor().submit(self._run_manual, job_id, meta['func'])
+            logger.info("Triggered immediate run of job: %s (manual queue depth %d)",
+                        job_id, depth)
+            return TriggerResult.TRIGGERED
         except Exception as exc:
+            with self._manual_lock:
+                self._manual_pending -= 1
+                self._manual_active.discard(job_id)
             logger.error("Failed to trigger job %s: %s", job_id, exc)
-            return False
+            return TriggerResult.FAILED
 
     def update_job_schedule(self, job_id: str, trigger: str, **trigger_args) -> bool:
         """Update a job's schedule.